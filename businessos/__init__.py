@@ -9,8 +9,26 @@ __version__ = "0.1.0"
 __author__ = "Business OS Team"
 __email__ = "team@businessos.dev"
 
-from .core.ontology import Ontology
-from .core.compiler import Compiler
-from .core.validator import Validator
+__all__ = ["Ontology", "Compiler", "Validator"]
 
-__all__ = ["Ontology", "Compiler", "Validator"] 
\ No newline at end of file
+# Map of lazily imported names to their defining submodules (PEP 562).
+# Importing businessos for __version__ no longer pulls in yaml/jinja2.
+_LAZY_IMPORTS = {
+    "Ontology": ".core.ontology",
+    "Compiler": ".core.compiler",
+    "Validator": ".core.validator",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        import importlib
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_IMPORTS))
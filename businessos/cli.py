@@ -2,20 +2,71 @@
 Business OS CLI tool.
 """
 
+import functools
 import typer
 from pathlib import Path
 from typing import List, Optional
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-
-from .core.ontology import Ontology
-from .core.compiler import Compiler
-from .core.validator import Validator
 
 app = typer.Typer(help="Business OS: Business-as-Code Platform")
-console = Console()
+
+# Output file that marks each compile target as generated, relative to the
+# output directory; used for the up-to-date check in `compile`.
+_TARGET_MARKERS = {
+    "json-schema": "schema.json",
+    "pydantic": "models.py",
+    "typescript": "interfaces.ts",
+    "salesforce": "salesforce",
+    "hubspot": "hubspot/custom_properties.json",
+    "markdown": "markdown/ontology_documentation.md",
+}
+
+
+def _yaml():
+    """Import yaml with the libyaml C loader/dumper when available."""
+    import yaml
+    try:
+        from yaml import CSafeLoader as Loader, CSafeDumper as Dumper
+    except ImportError:
+        from yaml import SafeLoader as Loader, SafeDumper as Dumper
+    return yaml, Loader, Dumper
+
+
+@functools.lru_cache(maxsize=1)
+def _console():
+    """Create the Rich console lazily so `bos --help` skips the import."""
+    from rich.console import Console
+    return Console()
+
+
+@functools.lru_cache(maxsize=4)
+def _load_ontology_cached(path_str: str, mtime_ns: int):
+    from .core.ontology import Ontology
+
+    path = Path(path_str)
+    if path.is_file():
+        return Ontology.from_file(path)
+    return Ontology.from_directory_parallel(path)
+
+
+def _load_ontology(ontology_path: str):
+    """Load an ontology file or directory, reusing the parse when unchanged.
+
+    The cache key includes the newest input mtime, so edits invalidate
+    the entry while repeat loads in one process skip re-parsing. The key
+    enumerates files with the same walk the loaders use, so .yml edits
+    invalidate too.
+    """
+    from .core.ontology import _iter_yaml_files
+
+    path = Path(ontology_path)
+    if path.is_file():
+        mtime_ns = path.stat().st_mtime_ns
+    else:
+        mtime_ns = max(
+            (f.stat().st_mtime_ns for f in _iter_yaml_files(path)),
+            default=path.stat().st_mtime_ns
+        )
+    return _load_ontology_cached(str(path), mtime_ns)
 
 
 @app.command()
@@ -24,19 +75,23 @@ def init(
     template: str = typer.Option("basic", help="Template to use for initialization")
 ):
     """Initialize a new Business OS project."""
+    from rich.panel import Panel
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    console = _console()
     project_dir = Path(project_name)
-    
+
     if project_dir.exists():
         console.print(f"[red]Error: Project directory '{project_name}' already exists[/red]")
         raise typer.Exit(1)
-    
+
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
         console=console
     ) as progress:
         task = progress.add_task("Initializing project...", total=None)
-        
+
         # Create project structure
         project_dir.mkdir()
         (project_dir / "ontology").mkdir()
@@ -48,12 +103,12 @@ def init(
         (project_dir / "generated").mkdir()
         (project_dir / "models").mkdir()
         (project_dir / "tests").mkdir()
-        
+
         # Create initial ontology files
         _create_initial_ontologies(project_dir)
-        
+
         progress.update(task, description="Project initialized successfully!")
-    
+
     console.print(Panel(
         f"[green]Business OS project '{project_name}' created successfully![/green]\n\n"
         f"Next steps:\n"
@@ -65,55 +120,79 @@ def init(
     ))
 
 
+@app.command("compile-ontology")
+def compile_ontology(
+    ontology_path: str = typer.Argument("ontology", help="Path to ontology directory")
+):
+    """Precompile the ontology directory into an importable module."""
+    from .core.ontology import write_compiled_module
+
+    console = _console()
+    ontology_dir = Path(ontology_path)
+
+    if not ontology_dir.is_dir():
+        console.print(f"[red]Error: Ontology directory '{ontology_path}' not found[/red]")
+        raise typer.Exit(1)
+
+    try:
+        compiled_path = write_compiled_module(ontology_dir)
+        console.print(f"[green]✅ Compiled ontology written to {compiled_path}[/green]")
+    except Exception as e:
+        console.print(f"[red]Error compiling ontology: {e}[/red]")
+        raise typer.Exit(1)
+
+
 @app.command()
 def validate(
     ontology_path: str = typer.Argument("ontology", help="Path to ontology directory or file")
 ):
     """Validate Business OS ontology."""
+    from rich.table import Table
+
+    from .core.validator import Validator
+
+    console = _console()
     ontology_file = Path(ontology_path)
-    
+
     if not ontology_file.exists():
         console.print(f"[red]Error: Ontology path '{ontology_path}' not found[/red]")
         raise typer.Exit(1)
-    
+
     try:
-        if ontology_file.is_file():
-            ontology = Ontology.from_file(ontology_file)
-        else:
-            ontology = Ontology.from_directory(ontology_file)
-        
+        ontology = _load_ontology(ontology_path)
+
         validator = Validator(ontology)
         errors = validator.validate_all()
-        
+
         if not errors:
             console.print("[green]✅ Ontology is valid![/green]")
             return
-        
+
         # Display errors
         table = Table(title="Validation Errors")
         table.add_column("Severity", style="red")
         table.add_column("Location")
         table.add_column("Message")
-        
+
         for error in errors:
             severity_color = {
                 "error": "red",
-                "warning": "yellow", 
+                "warning": "yellow",
                 "info": "blue"
             }.get(error.severity, "white")
-            
+
             table.add_row(
                 f"[{severity_color}]{error.severity.upper()}[/{severity_color}]",
                 error.location or "unknown",
                 error.message
             )
-        
+
         console.print(table)
-        
+
         summary = validator.get_validation_summary()
         if not summary["is_valid"]:
             raise typer.Exit(1)
-    
+
     except Exception as e:
         console.print(f"[red]Error validating ontology: {e}[/red]")
         raise typer.Exit(1)
@@ -123,88 +202,148 @@ def validate(
 def compile(
     ontology_path: str = typer.Argument("ontology", help="Path to ontology directory or file"),
     target: str = typer.Option(
-        "json-schema", 
+        "json-schema",
         "--target", "-t",
         help="Target formats to compile to (comma-separated)"
     ),
     output_dir: str = typer.Option(
         "generated",
-        "--output", "-o", 
+        "--output", "-o",
         help="Output directory for generated files"
     ),
     segment: Optional[str] = typer.Option(
         None,
         "--segment", "-s",
         help="Specific segment to compile (if not specified, compiles all)"
+    ),
+    force: bool = typer.Option(
+        False,
+        "--force", "-f",
+        help="Recompile even if outputs are newer than the ontology"
     )
 ):
     """Compile Business OS ontology to various target formats."""
+    from .core.compiler import Compiler
+
+    console = _console()
     ontology_file = Path(ontology_path)
     output_path = Path(output_dir)
-    
+
     if not ontology_file.exists():
         console.print(f"[red]Error: Ontology path '{ontology_path}' not found[/red]")
         raise typer.Exit(1)
-    
+
     try:
-        if ontology_file.is_file():
-            ontology = Ontology.from_file(ontology_file)
-        else:
-            ontology = Ontology.from_directory(ontology_file)
-        
+        ontology = _load_ontology(ontology_path)
+
         compiler = Compiler(ontology)
-        
+
         # Parse target formats
         target_formats = [t.strip() for t in target.split(",")]
-        
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console
-        ) as progress:
-            task = progress.add_task("Compiling ontology...", total=len(target_formats))
-            
+
+        output_path.mkdir(parents=True, exist_ok=True)
+
+        # Makefile-style dependency check: a target whose output is newer
+        # than every ontology input doesn't need recompiling.
+        if ontology_file.is_file():
+            newest_input_mtime = ontology_file.stat().st_mtime
+        else:
+            from .core.ontology import _iter_yaml_files
+
+            newest_input_mtime = max(
+                (p.stat().st_mtime for p in _iter_yaml_files(ontology_file)),
+                default=0.0
+            )
+
+        # Marker mtimes can't tell a full compile from a --segment one,
+        # so remember which selection each target was last built with.
+        import json
+
+        stamp_path = output_path / ".bos_compile_stamp.json"
+        try:
+            last_selection = json.loads(stamp_path.read_text())
+        except (OSError, ValueError):
+            last_selection = {}
+
+        def _is_up_to_date(target_format: str) -> bool:
+            if force:
+                return False
+            marker = _TARGET_MARKERS.get(target_format)
+            if marker is None:
+                return False
+            if (target_format not in last_selection
+                    or last_selection[target_format] != segment):
+                return False
+            marker_path = output_path / marker
+            return (marker_path.exists()
+                    and marker_path.stat().st_mtime > newest_input_mtime)
+
+        # The live Progress display spawns a render thread and probes the
+        # terminal; skip it for single-target compiles and non-TTY (CI)
+        # output where it costs more than the compile itself.
+        import contextlib
+        import sys
+
+        if len(target_formats) > 1 and sys.stdout.isatty():
+            from rich.progress import Progress, SpinnerColumn, TextColumn
+            progress_ctx = Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                console=console
+            )
+        else:
+            progress_ctx = contextlib.nullcontext()
+
+        with progress_ctx as progress:
+            task = None
+            if progress is not None:
+                task = progress.add_task("Compiling ontology...", total=len(target_formats))
+
             for target_format in target_formats:
-                progress.update(task, description=f"Compiling to {target_format}...")
-                
+                if progress is not None:
+                    progress.update(task, description=f"Compiling to {target_format}...")
+
+                if _is_up_to_date(target_format):
+                    console.print(f"[cyan]{target_format} is up-to-date, skipping[/cyan]")
+                    if progress is not None:
+                        progress.advance(task)
+                    continue
+
                 if target_format == "json-schema":
+                    from .core.compiler import _write_json
                     schema = compiler.compile_to_json_schema(segment)
-                    output_path.mkdir(parents=True, exist_ok=True)
-                    schema_file = output_path / "schema.json"
-                    import json
-                    with open(schema_file, 'w') as f:
-                        json.dump(schema, f, indent=2)
-                
+                    _write_json(output_path / "schema.json", schema)
+
                 elif target_format == "pydantic":
                     code = compiler.compile_to_pydantic(segment)
-                    output_path.mkdir(parents=True, exist_ok=True)
-                    model_file = output_path / "models.py"
-                    with open(model_file, 'w') as f:
-                        f.write(code)
-                
+                    (output_path / "models.py").write_text(code)
+
                 elif target_format == "typescript":
                     code = compiler.compile_to_typescript(segment)
-                    output_path.mkdir(parents=True, exist_ok=True)
-                    interface_file = output_path / "interfaces.ts"
-                    with open(interface_file, 'w') as f:
-                        f.write(code)
-                
+                    (output_path / "interfaces.ts").write_text(code)
+
                 elif target_format == "salesforce":
                     compiler.compile_to_salesforce(output_path / "salesforce")
-                
+
                 elif target_format == "hubspot":
                     compiler.compile_to_hubspot(output_path / "hubspot")
-                
+
                 elif target_format == "markdown":
                     compiler.compile_to_markdown(output_path / "markdown")
-                
+
                 else:
                     console.print(f"[yellow]Warning: Unknown target format '{target_format}'[/yellow]")
-                
-                progress.advance(task)
-        
+
+                if target_format in _TARGET_MARKERS:
+                    last_selection[target_format] = segment
+
+                if progress is not None:
+                    progress.advance(task)
+
+        stamp_path.write_text(json.dumps(last_selection))
+
         console.print(f"[green]✅ Ontology compiled successfully to {output_dir}[/green]")
-    
+
     except Exception as e:
         console.print(f"[red]Error compiling ontology: {e}[/red]")
         raise typer.Exit(1)
@@ -215,42 +354,37 @@ def list_segments(
     ontology_path: str = typer.Argument("ontology", help="Path to ontology directory or file")
 ):
     """List all customer segments in the ontology."""
+    from rich.table import Table
+
+    console = _console()
     ontology_file = Path(ontology_path)
-    
+
     if not ontology_file.exists():
         console.print(f"[red]Error: Ontology path '{ontology_path}' not found[/red]")
         raise typer.Exit(1)
-    
+
     try:
-        if ontology_file.is_file():
-            ontology = Ontology.from_file(ontology_file)
-        else:
-            ontology = Ontology.from_directory(ontology_file)
-        
-        segments = ontology.list_segments()
-        
-        if not segments:
+        ontology = _load_ontology(ontology_path)
+
+        if not ontology.segments:
             console.print("[yellow]No segments found in ontology[/yellow]")
             return
-        
+
         table = Table(title="Customer Segments")
         table.add_column("Segment Name")
         table.add_column("Properties")
         table.add_column("Constraints")
-        
-        for segment_name in segments:
-            segment = ontology.get_segment(segment_name)
-            if segment:
-                prop_count = len(segment.properties)
-                constraint_count = len(segment.constraints)
-                table.add_row(
-                    segment_name,
-                    str(prop_count),
-                    str(constraint_count)
-                )
-        
+
+        # Walk the dict once; no need to look each name back up
+        for segment_name, segment in ontology.segments.items():
+            table.add_row(
+                segment_name,
+                str(len(segment.properties)),
+                str(len(segment.constraints))
+            )
+
         console.print(table)
-    
+
     except Exception as e:
         console.print(f"[red]Error listing segments: {e}[/red]")
         raise typer.Exit(1)
@@ -261,45 +395,38 @@ def list_campaigns(
     ontology_path: str = typer.Argument("ontology", help="Path to ontology directory or file")
 ):
     """List all marketing campaigns in the ontology."""
+    from rich.table import Table
+
+    console = _console()
     ontology_file = Path(ontology_path)
-    
+
     if not ontology_file.exists():
         console.print(f"[red]Error: Ontology path '{ontology_path}' not found[/red]")
         raise typer.Exit(1)
-    
+
     try:
-        if ontology_file.is_file():
-            ontology = Ontology.from_file(ontology_file)
-        else:
-            ontology = Ontology.from_directory(ontology_file)
-        
-        campaigns = ontology.list_campaigns()
-        
-        if not campaigns:
+        ontology = _load_ontology(ontology_path)
+
+        if not ontology.campaigns:
             console.print("[yellow]No campaigns found in ontology[/yellow]")
             return
-        
+
         table = Table(title="Marketing Campaigns")
         table.add_column("Campaign Name")
         table.add_column("Owner Team")
         table.add_column("Campaign Type")
         table.add_column("Components")
-        
-        for campaign_name in campaigns:
-            campaign = ontology.get_campaign(campaign_name)
-            if campaign:
-                owner_team = campaign.metadata.get("owner_team", "Unknown")
-                campaign_type = campaign.metadata.get("campaign_type", "Unknown")
-                component_count = len(campaign.components)
-                table.add_row(
-                    campaign_name,
-                    owner_team,
-                    campaign_type,
-                    str(component_count)
-                )
-        
+
+        for campaign_name, campaign in ontology.campaigns.items():
+            table.add_row(
+                campaign_name,
+                campaign.metadata.get("owner_team", "Unknown"),
+                campaign.metadata.get("campaign_type", "Unknown"),
+                str(len(campaign.components))
+            )
+
         console.print(table)
-    
+
     except Exception as e:
         console.print(f"[red]Error listing campaigns: {e}[/red]")
         raise typer.Exit(1)
@@ -314,51 +441,71 @@ def add_segment(
     annual_revenue: Optional[str] = typer.Option(None, help="Annual revenue range")
 ):
     """Add a new customer segment to the ontology."""
+    console = _console()
     ontology_dir = Path(ontology_path)
-    
+
     if not ontology_dir.exists():
         console.print(f"[red]Error: Ontology directory '{ontology_path}' not found[/red]")
         raise typer.Exit(1)
-    
+
     # Create basic segment definition
     segment_data = {
         "properties": {}
     }
-    
+
     if company_size:
         segment_data["properties"]["company_size"] = f'enum["{company_size}"]'
-    
+
     if industry:
         segment_data["properties"]["industry"] = f'enum["{industry}"]'
-    
+
     if annual_revenue:
         segment_data["properties"]["annual_revenue"] = f'range({annual_revenue})'
-    
+
     # Add to segments file
     segments_file = ontology_dir / "customers" / "segments.yaml"
-    
+
+    yaml, Loader, Dumper = _yaml()
     if segments_file.exists():
-        import yaml
-        with open(segments_file, 'r') as f:
-            data = yaml.safe_load(f) or {}
+        text = segments_file.read_text()
+        data = yaml.load(text, Loader=Loader) or {}
     else:
+        text = ""
         data = {}
-    
-    if "segments" not in data:
-        data["segments"] = {}
-    
-    data["segments"][name] = segment_data
-    
-    with open(segments_file, 'w') as f:
-        yaml.dump(data, f, default_flow_style=False, indent=2)
-    
+
+    if (isinstance(data.get("segments"), dict)
+            and name not in data["segments"]
+            # Appending is only safe when the fragment lands inside the
+            # segments mapping: the file must end with a newline and
+            # segments must be the last top-level key.
+            and next(reversed(data)) == "segments"
+            and text.endswith("\n")):
+        # Common case: the file already has a segments mapping and the
+        # segment is new, so append just the rendered fragment instead of
+        # re-serializing the whole document.
+        fragment = yaml.dump(
+            {name: segment_data}, Dumper=Dumper,
+            default_flow_style=False, indent=2
+        )
+        with open(segments_file, 'a') as f:
+            f.writelines(f"  {line}\n" for line in fragment.splitlines())
+    else:
+        # Structural rewrite needed (new file, or replacing a segment).
+        if "segments" not in data:
+            data["segments"] = {}
+
+        data["segments"][name] = segment_data
+
+        with open(segments_file, 'w') as f:
+            yaml.dump(data, f, Dumper=Dumper, default_flow_style=False, indent=2)
+
     console.print(f"[green]✅ Segment '{name}' added to ontology[/green]")
 
 
 def _create_initial_ontologies(project_dir: Path):
     """Create initial ontology files for a new project."""
-    import yaml
-    
+    yaml, _, Dumper = _yaml()
+
     # Create basic segments file
     segments_data = {
         "segments": {
@@ -375,11 +522,11 @@ def _create_initial_ontologies(project_dir: Path):
             }
         }
     }
-    
+
     segments_file = project_dir / "ontology" / "customers" / "segments.yaml"
     with open(segments_file, 'w') as f:
-        yaml.dump(segments_data, f, default_flow_style=False, indent=2)
-    
+        yaml.dump(segments_data, f, Dumper=Dumper, default_flow_style=False, indent=2)
+
     # Create basic campaigns file
     campaigns_data = {
         "campaigns": {
@@ -401,16 +548,88 @@ def _create_initial_ontologies(project_dir: Path):
             }
         }
     }
-    
+
     campaigns_file = project_dir / "ontology" / "marketing" / "campaigns.yaml"
     with open(campaigns_file, 'w') as f:
-        yaml.dump(campaigns_data, f, default_flow_style=False, indent=2)
+        yaml.dump(campaigns_data, f, Dumper=Dumper, default_flow_style=False, indent=2)
+
+
+def fast_main():
+    """Argparse-based entry point for non-interactive usage.
+
+    Dispatches to the same command functions as the Typer app but skips
+    Typer's import-time command introspection, which dominates cold start
+    in CI/CD runs where the subcommand is already known.
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="bos-fast",
+        description="Business OS: Business-as-Code Platform"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    sub = subparsers.add_parser("init", help="Initialize a new Business OS project")
+    sub.add_argument("project_name")
+    sub.add_argument("--template", default="basic")
+
+    sub = subparsers.add_parser("validate", help="Validate Business OS ontology")
+    sub.add_argument("ontology_path", nargs="?", default="ontology")
+
+    sub = subparsers.add_parser("compile", help="Compile ontology to target formats")
+    sub.add_argument("ontology_path", nargs="?", default="ontology")
+    sub.add_argument("--target", "-t", default="json-schema")
+    sub.add_argument("--output", "-o", dest="output_dir", default="generated")
+    sub.add_argument("--segment", "-s", default=None)
+    sub.add_argument("--force", "-f", action="store_true")
+
+    sub = subparsers.add_parser("list-segments", help="List all customer segments")
+    sub.add_argument("ontology_path", nargs="?", default="ontology")
+
+    sub = subparsers.add_parser("list-campaigns", help="List all marketing campaigns")
+    sub.add_argument("ontology_path", nargs="?", default="ontology")
+
+    sub = subparsers.add_parser("add-segment", help="Add a new customer segment")
+    sub.add_argument("name")
+    sub.add_argument("--ontology-path", default="ontology")
+    sub.add_argument("--company-size", default=None)
+    sub.add_argument("--industry", default=None)
+    sub.add_argument("--annual-revenue", default=None)
+
+    args = parser.parse_args()
+
+    try:
+        if args.command == "init":
+            init(args.project_name, args.template)
+        elif args.command == "validate":
+            validate(args.ontology_path)
+        elif args.command == "compile":
+            compile(args.ontology_path, args.target, args.output_dir,
+                    args.segment, args.force)
+        elif args.command == "list-segments":
+            list_segments(args.ontology_path)
+        elif args.command == "list-campaigns":
+            list_campaigns(args.ontology_path)
+        elif args.command == "add-segment":
+            add_segment(args.name, args.ontology_path, args.company_size,
+                        args.industry, args.annual_revenue)
+    except typer.Exit as exc:
+        raise SystemExit(exc.exit_code)
 
 
 def main():
     """Main entry point for the CLI."""
+    # Fast path: answer --version without constructing the Typer parser,
+    # which would introspect every command signature just to print a string.
+    import sys
+
+    if len(sys.argv) == 2 and sys.argv[1] in ("-v", "--version"):
+        from . import __version__
+        print(f"bos {__version__}")
+        return
+
     app()
 
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
@@ -4,24 +4,164 @@ Compiler for transforming Business OS ontologies into various target formats.
 
 from __future__ import annotations
 
+import copy
+import functools
 import json
+import threading
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 from jinja2 import Environment, FileSystemLoader, Template
-from .ontology import Ontology
+from .ontology import Ontology, parse_property_type
+
+
+def _get_template_dir() -> Path:
+    """Get the template directory."""
+    return Path(__file__).parent.parent / "templates"
+
+
+# Shared Jinja environment: templates ship with the package and never change
+# at runtime, so disable auto-reload stat calls and keep the cache unbounded.
+_ENV = Environment(
+    loader=FileSystemLoader(_get_template_dir()),
+    auto_reload=False,
+    cache_size=-1,
+)
+_TEMPLATES: Dict[str, Template] = {}
+_TEMPLATES_LOCK = threading.Lock()
+
+
+def _tpl(name: str) -> Template:
+    """Get a compiled template, parsing it at most once per process."""
+    template = _TEMPLATES.get(name)
+    if template is None:
+        # Lock the miss path so worker threads don't parse the same
+        # template concurrently during parallel code generation.
+        with _TEMPLATES_LOCK:
+            template = _TEMPLATES.get(name)
+            if template is None:
+                template = _TEMPLATES[name] = _ENV.get_template(name)
+    return template
+
+
+# Expected output files per single-file compile target, used by the
+# incremental-compile fingerprint check.
+_TARGET_OUTPUTS = {
+    "json-schema": ("schema.json",),
+    "pydantic": ("models.py",),
+    "typescript": ("interfaces.ts",),
+}
+
+# Scalar type names dispatch straight to their JSON Schema fragment.
+_SCALAR_SCHEMAS = {
+    "boolean": {"type": "boolean"},
+    "int": {"type": "integer"},
+    "float": {"type": "number"},
+    "datetime": {"type": "string", "format": "date-time"},
+}
+
+
+def _write_json(path: Path, data: Dict[str, Any]) -> None:
+    """Write pretty-printed JSON, using orjson's C encoder when available."""
+    try:
+        import orjson
+    except ImportError:
+        path.write_text(json.dumps(data, indent=2))
+    else:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+
+
+# The same property-definition strings recur across segments and across
+# compile targets, so the string-keyed converters below are memoized and
+# dispatch on the structured form parsed once by the ontology module.
+# Callers treat the returned dicts as read-only render context.
+
+def _json_schema_from_parsed(parsed: Dict[str, Any]) -> Dict[str, Any]:
+    """Build a JSON Schema fragment from a parsed property type."""
+    kind = parsed["kind"]
+    if kind == "enum":
+        # Fresh list: the parsed form is a shared lru_cache entry and
+        # must not leak a mutable reference into schema fragments.
+        return {"type": "string", "enum": list(parsed["values"])}
+    if kind == "list":
+        return {"type": "array", "items": _json_schema_from_parsed(parsed["inner"])}
+    if kind == "range":
+        return {
+            "type": "number",
+            "minimum": parsed["min_value"],
+            "maximum": parsed["max_value"]
+        }
+    if kind == "basic":
+        scalar = _SCALAR_SCHEMAS.get(parsed["name"])
+        if scalar is not None:
+            return scalar.copy()
+    return {"type": "string"}
+
+
+@functools.lru_cache(maxsize=1024)
+def _json_schema_for_type(type_def: str) -> Dict[str, Any]:
+    """Parse a type definition string into a JSON Schema fragment."""
+    return _json_schema_from_parsed(parse_property_type(type_def))
+
+
+@functools.lru_cache(maxsize=1024)
+def _salesforce_type_attrs(field_def: str) -> Dict[str, Any]:
+    """Map a property type string to Salesforce field attribute overrides."""
+    parsed = parse_property_type(field_def)
+    if parsed["kind"] == "enum":
+        return {"type": "Picklist", "values": parsed["values"]}
+    if field_def == "boolean":
+        return {"type": "Checkbox"}
+    if field_def == "int":
+        return {"type": "Number", "precision": 18, "scale": 0}
+    if field_def == "float":
+        return {"type": "Number", "precision": 18, "scale": 2}
+    if field_def == "datetime":
+        return {"type": "DateTime"}
+    return {}
+
+
+@functools.lru_cache(maxsize=1024)
+def _hubspot_type_attrs(prop_def: str) -> Dict[str, Any]:
+    """Map a property type string to HubSpot property attribute overrides."""
+    parsed = parse_property_type(prop_def)
+    if parsed["kind"] == "enum":
+        return {
+            "type": "enumeration",
+            "options": [
+                {"label": val, "value": val} for val in parsed["values"]
+            ]
+        }
+    if prop_def == "boolean":
+        return {"type": "boolean"}
+    if prop_def in ("int", "float"):
+        return {"type": "number"}
+    if prop_def == "datetime":
+        return {"type": "datetime"}
+    return {}
 
 
 class Compiler:
     """Compiles Business OS ontologies into various target formats."""
-    
+
     def __init__(self, ontology: Ontology):
         self.ontology = ontology
-        self.env = Environment(loader=FileSystemLoader(self._get_template_dir()))
-    
-    def _get_template_dir(self) -> Path:
-        """Get the template directory."""
-        return Path(__file__).parent.parent / "templates"
-    
+        self.env = _ENV
+
+    @functools.cached_property
+    def _canonical_segments(self) -> Dict[str, Dict[str, Any]]:
+        """Converted property schemas per segment, computed once per compiler.
+
+        Compiling several targets in one run reuses this instead of
+        re-walking and re-parsing every segment's property definitions.
+        """
+        return {
+            name: {
+                "properties": self._convert_properties_to_json_schema(segment.properties),
+                "constraints": segment.constraints,
+            }
+            for name, segment in self.ontology.segments.items()
+        }
+
     def compile_to_json_schema(self, segment_name: Optional[str] = None) -> Dict[str, Any]:
         """Compile ontology to JSON Schema."""
         schema = {
@@ -32,22 +172,22 @@ class Compiler:
         }
         
         if segment_name:
-            segment = self.ontology.get_segment(segment_name)
-            if not segment:
+            canonical = self._canonical_segments.get(segment_name)
+            if canonical is None:
                 raise ValueError(f"Segment {segment_name} not found")
-            
+
             schema["title"] = f"{segment_name} Schema"
-            schema["properties"] = self._convert_properties_to_json_schema(segment.properties)
+            schema["properties"] = canonical["properties"]
         else:
             # Compile all segments
             schema["title"] = "Business OS Ontology Schema"
-            for name, segment in self.ontology.segments.items():
+            for name, canonical in self._canonical_segments.items():
                 schema["properties"][name] = {
                     "type": "object",
                     "title": name,
-                    "properties": self._convert_properties_to_json_schema(segment.properties)
+                    "properties": canonical["properties"]
                 }
-        
+
         return schema
     
     def _convert_properties_to_json_schema(self, properties: Dict[str, Any]) -> Dict[str, Any]:
@@ -68,58 +208,10 @@ class Compiler:
     
     def _parse_type_definition(self, type_def: str) -> Dict[str, Any]:
         """Parse a type definition string into JSON Schema."""
-        if type_def.startswith("enum["):
-            # Parse enum type
-            enum_values = type_def[5:-1].split(", ")
-            return {
-                "type": "string",
-                "enum": enum_values
-            }
-        elif type_def.startswith("list["):
-            # Parse list type
-            inner_type = type_def[5:-1]
-            return {
-                "type": "array",
-                "items": self._parse_type_definition(inner_type)
-            }
-        elif type_def.startswith("range("):
-            # Parse range type
-            range_def = type_def[6:-1]
-            min_val, max_val = range_def.split(", ")
-            
-            # Handle units like K, M, B, %
-            def parse_value(val):
-                val = val.strip()
-                if val.endswith('K'):
-                    return float(val[:-1]) * 1000
-                elif val.endswith('M'):
-                    return float(val[:-1]) * 1000000
-                elif val.endswith('B+'):
-                    return float(val[:-2]) * 1000000000
-                elif val.endswith('B'):
-                    return float(val[:-1]) * 1000000000
-                elif val.endswith('%'):
-                    return float(val[:-1])
-                elif val.endswith('+'):
-                    return float(val[:-1])
-                else:
-                    return float(val)
-            
-            return {
-                "type": "number",
-                "minimum": parse_value(min_val),
-                "maximum": parse_value(max_val)
-            }
-        elif type_def == "boolean":
-            return {"type": "boolean"}
-        elif type_def == "int":
-            return {"type": "integer"}
-        elif type_def == "float":
-            return {"type": "number"}
-        elif type_def == "datetime":
-            return {"type": "string", "format": "date-time"}
-        else:
-            return {"type": "string"}
+        # Deep copy: a shallow dict() would still share nested enum
+        # lists and list-items dicts with the cached fragment, letting
+        # one caller's mutation corrupt every later compile.
+        return copy.deepcopy(_json_schema_for_type(type_def))
     
     def _parse_complex_type(self, type_def: Dict[str, Any]) -> Dict[str, Any]:
         """Parse a complex type definition."""
@@ -131,7 +223,7 @@ class Compiler:
     
     def compile_to_pydantic(self, segment_name: Optional[str] = None) -> str:
         """Compile ontology to Pydantic models."""
-        template = self.env.get_template("pydantic_model.py.j2")
+        template = _tpl("pydantic_model.py.j2")
         
         if segment_name:
             segment = self.ontology.get_segment(segment_name)
@@ -153,7 +245,7 @@ class Compiler:
     
     def compile_to_typescript(self, segment_name: Optional[str] = None) -> str:
         """Compile ontology to TypeScript interfaces."""
-        template = self.env.get_template("typescript_interfaces.ts.j2")
+        template = _tpl("typescript_interfaces.ts.j2")
         
         if segment_name:
             segment = self.ontology.get_segment(segment_name)
@@ -176,37 +268,70 @@ class Compiler:
     def compile_to_salesforce(self, output_dir: Union[str, Path]) -> None:
         """Compile ontology to Salesforce metadata."""
         output_dir = Path(output_dir)
-        output_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Generate custom objects
-        for segment_name, segment in self.ontology.segments.items():
-            self._generate_salesforce_object(segment_name, segment, output_dir)
-        
-        # Generate validation rules
-        self._generate_salesforce_validation_rules(output_dir)
-    
-    def _generate_salesforce_object(self, segment_name: str, segment: Any, output_dir: Path) -> None:
+        segments = self.ontology.segments
+
+        # Create every directory the compile will touch in one pass up
+        # front, rather than paying a stat+mkdir pair per segment inside
+        # the render helpers.
+        dirs_needed = {output_dir}
+        dirs_needed.update(output_dir / "objects" / name for name in segments)
+        dirs_needed.update(
+            output_dir / "validationRules" / name
+            for name, segment in segments.items() if segment.constraints
+        )
+        for needed_dir in sorted(dirs_needed):
+            needed_dir.mkdir(parents=True, exist_ok=True)
+
+        # Fetch both templates once, then render everything a segment needs
+        # (custom object plus any validation rules) in a single pass.
+        object_template = _tpl("salesforce_object.xml.j2")
+        validation_template = _tpl("salesforce_validation.xml.j2")
+
+        def _emit_segment(item: tuple) -> None:
+            segment_name, segment = item
+            self._generate_salesforce_object(
+                segment_name, segment, output_dir, object_template
+            )
+            if segment.constraints:
+                self._generate_salesforce_validation_rule(
+                    segment_name, segment, output_dir, validation_template
+                )
+
+        if len(segments) > 1:
+            # Segments render and write independently, so overlap the
+            # file I/O across a small thread pool.
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=min(8, len(segments))) as executor:
+                list(executor.map(_emit_segment, segments.items()))
+        else:
+            for item in segments.items():
+                _emit_segment(item)
+
+    def _generate_salesforce_object(
+        self, segment_name: str, segment: Any, output_dir: Path,
+        template: Optional[Template] = None
+    ) -> None:
         """Generate Salesforce custom object metadata."""
-        template = self.env.get_template("salesforce_object.xml.j2")
-        
+        if template is None:
+            template = _tpl("salesforce_object.xml.j2")
+
         # Convert properties to Salesforce fields
         fields = []
         for prop_name, prop_def in segment.properties.items():
             field = self._convert_to_salesforce_field(prop_name, prop_def)
             fields.append(field)
-        
-        content = template.render(
-            object_name=segment_name,
-            fields=fields,
-            description=segment.description or f"Custom object for {segment_name}"
-        )
-        
-        # Write to file
+
+        # Stream rendered chunks straight to the file instead of building
+        # the whole document in memory first.
+        # compile_to_salesforce pre-creates the directory.
         object_dir = output_dir / "objects" / segment_name
-        object_dir.mkdir(parents=True, exist_ok=True)
-        
         with open(object_dir / f"{segment_name}.object-meta.xml", 'w') as f:
-            f.write(content)
+            template.stream(
+                object_name=segment_name,
+                fields=fields,
+                description=segment.description or f"Custom object for {segment_name}"
+            ).dump(f)
     
     def _convert_to_salesforce_field(self, field_name: str, field_def: Any) -> Dict[str, Any]:
         """Convert ontology property to Salesforce field definition."""
@@ -218,48 +343,31 @@ class Compiler:
         }
         
         if isinstance(field_def, str):
-            if field_def.startswith("enum["):
-                field["type"] = "Picklist"
-                enum_values = field_def[5:-1].split(", ")
-                field["values"] = enum_values
-            elif field_def == "boolean":
-                field["type"] = "Checkbox"
-            elif field_def == "int":
-                field["type"] = "Number"
-                field["precision"] = 18
-                field["scale"] = 0
-            elif field_def == "float":
-                field["type"] = "Number"
-                field["precision"] = 18
-                field["scale"] = 2
-            elif field_def == "datetime":
-                field["type"] = "DateTime"
-        
+            field.update(_salesforce_type_attrs(field_def))
+
         return field
     
-    def _generate_salesforce_validation_rules(self, output_dir: Path) -> None:
-        """Generate Salesforce validation rules from constraints."""
-        template = self.env.get_template("salesforce_validation.xml.j2")
-        
-        for segment_name, segment in self.ontology.segments.items():
-            if segment.constraints:
-                content = template.render(
-                    segment_name=segment_name,
-                    constraints=segment.constraints
-                )
-                
-                validation_dir = output_dir / "validationRules" / segment_name
-                validation_dir.mkdir(parents=True, exist_ok=True)
-                
-                with open(validation_dir / f"{segment_name}_ValidationRule.validationRule-meta.xml", 'w') as f:
-                    f.write(content)
+    def _generate_salesforce_validation_rule(
+        self, segment_name: str, segment: Any, output_dir: Path,
+        template: Optional[Template] = None
+    ) -> None:
+        """Generate Salesforce validation rules for one segment's constraints."""
+        if template is None:
+            template = _tpl("salesforce_validation.xml.j2")
+
+        validation_dir = output_dir / "validationRules" / segment_name
+        with open(validation_dir / f"{segment_name}_ValidationRule.validationRule-meta.xml", 'w') as f:
+            template.stream(
+                segment_name=segment_name,
+                constraints=segment.constraints
+            ).dump(f)
     
     def compile_to_hubspot(self, output_dir: Union[str, Path]) -> None:
         """Compile ontology to HubSpot custom properties."""
         output_dir = Path(output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
         
-        template = self.env.get_template("hubspot_properties.json.j2")
+        template = _tpl("hubspot_properties.json.j2")
         
         properties = []
         for segment_name, segment in self.ontology.segments.items():
@@ -268,9 +376,8 @@ class Compiler:
                 properties.append(property_def)
         
         content = template.render(properties=properties)
-        
-        with open(output_dir / "custom_properties.json", 'w') as f:
-            f.write(content)
+
+        (output_dir / "custom_properties.json").write_text(content)
     
     def _convert_to_hubspot_property(self, prop_name: str, prop_def: Any) -> Dict[str, Any]:
         """Convert ontology property to HubSpot property definition."""
@@ -282,19 +389,8 @@ class Compiler:
         }
         
         if isinstance(prop_def, str):
-            if prop_def.startswith("enum["):
-                property_def["type"] = "enumeration"
-                enum_values = prop_def[5:-1].split(", ")
-                property_def["options"] = [{"label": val, "value": val} for val in enum_values]
-            elif prop_def == "boolean":
-                property_def["type"] = "boolean"
-            elif prop_def == "int":
-                property_def["type"] = "number"
-            elif prop_def == "float":
-                property_def["type"] = "number"
-            elif prop_def == "datetime":
-                property_def["type"] = "datetime"
-        
+            property_def.update(_hubspot_type_attrs(prop_def))
+
         return property_def
     
     def compile_to_markdown(self, output_dir: Union[str, Path]) -> None:
@@ -303,50 +399,100 @@ class Compiler:
         output_dir.mkdir(parents=True, exist_ok=True)
         
         # Generate main documentation
-        template = self.env.get_template("ontology_docs.md.j2")
+        template = _tpl("ontology_docs.md.j2")
         content = template.render(
             segments=self.ontology.segments,
             campaigns=self.ontology.campaigns,
             lead_scoring=self.ontology.lead_scoring
         )
         
-        with open(output_dir / "ontology_documentation.md", 'w') as f:
-            f.write(content)
+        (output_dir / "ontology_documentation.md").write_text(content)
         
         # Generate individual segment docs
-        for segment_name, segment in self.ontology.segments.items():
-            segment_template = self.env.get_template("segment_docs.md.j2")
-            segment_content = segment_template.render(
-                segment_name=segment_name,
-                segment=segment
-            )
-            
+        segment_template = _tpl("segment_docs.md.j2")
+
+        def _emit_segment_doc(item: tuple) -> None:
+            segment_name, segment = item
             with open(output_dir / f"{segment_name}_documentation.md", 'w') as f:
-                f.write(segment_content)
+                segment_template.stream(
+                    segment_name=segment_name,
+                    segment=segment
+                ).dump(f)
+
+        segments = self.ontology.segments
+        if len(segments) > 1:
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=min(8, len(segments))) as executor:
+                list(executor.map(_emit_segment_doc, segments.items()))
+        else:
+            for item in segments.items():
+                _emit_segment_doc(item)
     
-    def compile_all(self, output_dir: Union[str, Path], targets: List[str]) -> None:
-        """Compile ontology to multiple target formats."""
+    def fingerprint(self) -> str:
+        """Hash of the ontology content plus template mtimes.
+
+        Two compiles with the same fingerprint produce identical output,
+        so targets whose recorded fingerprint matches can be skipped.
+        """
+        import hashlib
+
+        ontology_json = json.dumps(self.ontology.to_dict(), sort_keys=True, default=str)
+        template_mtimes = ",".join(
+            f"{path.name}:{path.stat().st_mtime_ns}"
+            for path in sorted(_get_template_dir().glob("*.j2"))
+        )
+        return hashlib.blake2b((ontology_json + template_mtimes).encode()).hexdigest()
+
+    def _target_is_current(self, target: str, target_dir: Path) -> bool:
+        """Check that a target's expected output files already exist."""
+        expected = _TARGET_OUTPUTS.get(target)
+        if expected is None:
+            # Directory-tree targets (salesforce, hubspot, markdown):
+            # treat any existing output as current.
+            return target_dir.is_dir() and any(target_dir.iterdir())
+        return all((target_dir / name).exists() for name in expected)
+
+    def compile_all(self, output_dir: Union[str, Path], targets: List[str],
+                    force: bool = False) -> None:
+        """Compile ontology to multiple target formats.
+
+        Targets whose inputs (ontology content and templates) are unchanged
+        since the last run are skipped unless ``force`` is set.
+        """
         output_dir = Path(output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
-        
+
+        # Always read the recorded fingerprints; force only bypasses the
+        # skip check below, and the rewrite at the end must not discard
+        # entries for targets outside this run.
+        fingerprint_file = output_dir / ".bos_fingerprint.json"
+        fingerprints: Dict[str, str] = {}
+        if fingerprint_file.exists():
+            try:
+                fingerprints = json.loads(fingerprint_file.read_text())
+            except (OSError, json.JSONDecodeError):
+                fingerprints = {}
+
+        key = self.fingerprint()
+
         for target in targets:
             target_dir = output_dir / target
             target_dir.mkdir(exist_ok=True)
-            
+
+            if (not force and fingerprints.get(target) == key
+                    and self._target_is_current(target, target_dir)):
+                continue
+
             if target == "json-schema":
                 schema = self.compile_to_json_schema()
-                with open(target_dir / "schema.json", 'w') as f:
-                    json.dump(schema, f, indent=2)
+                _write_json(target_dir / "schema.json", schema)
             
             elif target == "pydantic":
-                code = self.compile_to_pydantic()
-                with open(target_dir / "models.py", 'w') as f:
-                    f.write(code)
+                (target_dir / "models.py").write_text(self.compile_to_pydantic())
             
             elif target == "typescript":
-                code = self.compile_to_typescript()
-                with open(target_dir / "interfaces.ts", 'w') as f:
-                    f.write(code)
+                (target_dir / "interfaces.ts").write_text(self.compile_to_typescript())
             
             elif target == "salesforce":
                 self.compile_to_salesforce(target_dir)
@@ -356,6 +502,11 @@ class Compiler:
             
             elif target == "markdown":
                 self.compile_to_markdown(target_dir)
-            
+
             else:
-                print(f"Warning: Unknown target format '{target}'") 
\ No newline at end of file
+                print(f"Warning: Unknown target format '{target}'")
+                continue
+
+            fingerprints[target] = key
+
+        fingerprint_file.write_text(json.dumps(fingerprints, indent=2)) 
\ No newline at end of file
@@ -4,14 +4,36 @@ Core ontology parser and model for Business OS.
 
 from __future__ import annotations
 
-import yaml
+import functools
+import logging
+import os
+import re
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
-from pydantic import BaseModel, Field, field_validator
-from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple, Union
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError as PydanticValidationError
+from dataclasses import dataclass, field
 from enum import Enum
 
 
+@functools.lru_cache(maxsize=1)
+def _yaml():
+    """Import yaml on first use, preferring the libyaml C loader/dumper.
+
+    YAML parsing dominates ontology load time and the C implementation
+    is several times faster than pure-Python PyYAML; deferring the
+    import keeps it off the cost of merely importing this module.
+    """
+    import yaml
+    try:
+        from yaml import CSafeLoader as Loader, CSafeDumper as Dumper
+    except ImportError:
+        from yaml import SafeLoader as Loader, SafeDumper as Dumper
+    return yaml, Loader, Dumper
+
+
+logger = logging.getLogger(__name__)
+
+
 class DataType(str, Enum):
     """Supported data types in the ontology."""
     STRING = "string"
@@ -25,20 +47,165 @@ class DataType(str, Enum):
     DATETIME = "datetime"
 
 
-@dataclass
+# Property type strings (enum[...], list[...], range(...)) are parsed once
+# here and the structured result is shared by the compiler and validator,
+# instead of each consumer re-splitting the same raw strings.
+_TYPE_RE = re.compile(
+    r"^(?:enum\[(?P<enum>[^\]]*)\]|list\[(?P<list>.*)\]|range\((?P<range>[^)]*)\))$"
+)
+_RANGE_VALUE_RE = re.compile(r"^([\d.]+)\s*([KMB]\+?|\+|%)?$")
+_UNIT_MULTIPLIERS = {"K": 1_000.0, "M": 1_000_000.0, "B": 1_000_000_000.0}
+_BASIC_TYPES = frozenset({"string", "int", "float", "boolean", "datetime"})
+
+# Directory loads with at least this many files parse in a process pool.
+_PROCESS_POOL_MIN_FILES = 4
+
+
+def _iter_yaml_files(directory: Path) -> List[Path]:
+    """Collect YAML files under a directory with a batched scandir walk.
+
+    Each directory is read in one pass and entry type checks reuse the
+    dirent data, avoiding the per-entry stat calls rglob incurs.
+    """
+    files = []
+    stack = [directory]
+    while stack:
+        current = stack.pop()
+        with os.scandir(current) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(Path(entry.path))
+                elif entry.name.endswith(('.yaml', '.yml')) and entry.is_file(follow_symlinks=False):
+                    files.append(Path(entry.path))
+    files.sort()
+    return files
+
+
+def _source_hash(directory: Path) -> str:
+    """Fingerprint the YAML inputs under a directory by path/size/mtime."""
+    import hashlib
+
+    entries = []
+    for yaml_file in _iter_yaml_files(directory):
+        stat = yaml_file.stat()
+        entries.append((str(yaml_file), stat.st_size, stat.st_mtime_ns))
+    return hashlib.blake2b(repr(entries).encode()).hexdigest()
+
+
+def _load_compiled(compiled_path: Path, expected_hash: str) -> Optional[Dict[str, Any]]:
+    """Import a precompiled ontology module if its source hash matches.
+
+    The import goes through SourceFileLoader, so Python's bytecode cache
+    applies: warm loads unmarshal literals straight from the .pyc with
+    no YAML tokenization at all.
+    """
+    import importlib.util
+
+    module_name = f"_bos_compiled_{abs(hash(str(compiled_path)))}"
+    spec = importlib.util.spec_from_file_location(module_name, compiled_path)
+    if spec is None or spec.loader is None:
+        return None
+    module = importlib.util.module_from_spec(spec)
+    try:
+        spec.loader.exec_module(module)
+    except Exception:
+        return None
+    if getattr(module, "SOURCE_HASH", None) != expected_hash:
+        return None
+    return getattr(module, "DATA", None)
+
+
+def write_compiled_module(directory: Union[str, Path]) -> Path:
+    """Precompile a directory's YAML into an importable _compiled.py.
+
+    The module stores the merged, transformed ontology data as a Python
+    literal plus the source hash used for staleness checks; subsequent
+    `Ontology.from_directory` calls import it instead of parsing YAML.
+    """
+    directory = Path(directory)
+    ontology = Ontology.from_directory(directory, use_compiled=False)
+    compiled_path = directory / "_compiled.py"
+    compiled_path.write_text(
+        '"""Precompiled ontology data.\n'
+        '\n'
+        'Generated by `bos compile-ontology`; do not edit by hand.\n'
+        '"""\n'
+        '\n'
+        f"SOURCE_HASH = {_source_hash(directory)!r}\n"
+        '\n'
+        f"DATA = {ontology.to_dict()!r}\n"
+    )
+    return compiled_path
+
+
+def parse_range_value(val: str) -> float:
+    """Parse a range bound, handling units like K, M, B, % and trailing +."""
+    match = _RANGE_VALUE_RE.match(val.strip())
+    if not match:
+        return float(val)
+    number, suffix = match.groups()
+    multiplier = _UNIT_MULTIPLIERS.get((suffix or "").rstrip("+%"), 1.0)
+    return float(number) * multiplier
+
+
+@functools.lru_cache(maxsize=1024)
+def parse_property_type(type_def: str) -> Dict[str, Any]:
+    """Parse a property type string into a structured, reusable form.
+
+    Results are cached and shared across callers; treat them as read-only.
+    """
+    match = _TYPE_RE.match(type_def)
+    if match is None:
+        kind = "basic" if type_def in _BASIC_TYPES else "unknown"
+        return {"kind": kind, "name": type_def}
+
+    enum_content, list_content, range_content = match.group("enum", "list", "range")
+
+    if enum_content is not None:
+        values = enum_content.split(", ")
+        cleaned_values = tuple(val.strip().strip('"') for val in values)
+        return {
+            "kind": "enum",
+            "values": values,
+            "cleaned_values": cleaned_values,
+            # O(1) membership for validators; built once per unique type.
+            "value_set": frozenset(cleaned_values),
+        }
+
+    if list_content is not None:
+        return {"kind": "list", "inner": parse_property_type(list_content)}
+
+    parts = range_content.split(", ")
+    if len(parts) != 2:
+        return {"kind": "unknown", "name": type_def}
+    try:
+        min_value = parse_range_value(parts[0])
+        max_value = parse_range_value(parts[1])
+    except ValueError:
+        return {"kind": "unknown", "name": type_def}
+    return {
+        "kind": "range",
+        "min": parts[0],
+        "max": parts[1],
+        "min_value": min_value,
+        "max_value": max_value,
+    }
+
+
+# These records are created en masse during ontology load; slots drop the
+# per-instance __dict__ and frozen keeps them safely shareable (and, with
+# hashable fields, usable as cache keys).
+
+@dataclass(slots=True, frozen=True)
 class PropertyDefinition:
     """Definition of a property in the ontology."""
     name: str
     data_type: DataType
-    constraints: List[str] = None
+    constraints: List[str] = field(default_factory=list)
     description: Optional[str] = None
-    
-    def __post_init__(self):
-        if self.constraints is None:
-            self.constraints = []
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Constraint:
     """Business constraint definition."""
     expression: str
@@ -46,7 +213,7 @@ class Constraint:
     severity: str = "error"  # error, warning, info
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class JourneyStage:
     """Customer journey stage definition."""
     name: str
@@ -63,15 +230,22 @@ class CustomerSegment(BaseModel):
     constraints: List[str] = Field(default_factory=list)
     journey_stages: Dict[str, JourneyStage] = Field(default_factory=dict)
     description: Optional[str] = None
-    
-    @field_validator('properties')
-    @classmethod
-    def validate_properties(cls, v):
-        """Validate that properties are well-formed."""
-        for key, value in v.items():
-            if not isinstance(key, str):
-                raise ValueError(f"Property name must be string, got {type(key)}")
-        return v
+
+    @functools.cached_property
+    def parsed_properties(self) -> Dict[str, Dict[str, Any]]:
+        """Structured property definitions, parsed once per segment."""
+        parsed = {}
+        for name, prop_def in self.properties.items():
+            if isinstance(prop_def, str):
+                parsed[name] = parse_property_type(prop_def)
+            elif isinstance(prop_def, dict):
+                parsed[name] = {
+                    "kind": "complex",
+                    "properties": prop_def.get("properties", {}),
+                }
+            else:
+                parsed[name] = {"kind": "unknown", "name": prop_def}
+        return parsed
 
 
 class Campaign(BaseModel):
@@ -101,71 +275,141 @@ class Ontology(BaseModel):
     types: Dict[str, Any] = Field(default_factory=dict)
     
     @classmethod
-    def from_file(cls, file_path: Union[str, Path]) -> Ontology:
-        """Load ontology from YAML file."""
+    def from_dict(cls, data: Dict[str, Any], validate: bool = True) -> Ontology:
+        """Build an ontology from already-parsed data, no YAML round-trip.
+
+        Applies the same name-injection transform as the file loaders,
+        so callers can pass raw ``{"segments": {...}}`` mappings.
+        """
+        data = _transform_raw(data or {})
+        if validate:
+            return _ONTOLOGY_ADAPTER.validate_python(data)
+        return _construct_ontology(data)
+
+    @classmethod
+    def from_file(cls, file_path: Union[str, Path], validate: bool = True) -> Ontology:
+        """Load ontology from YAML file.
+
+        Parses are memoized on (path, mtime, size), so repeated loads of
+        an unchanged file return the cached ontology without re-parsing.
+        With ``validate=False`` the models are assembled via
+        ``model_construct``, skipping pydantic's recursive validation for
+        files already known to be well-formed (e.g. generated or
+        previously validated ontologies).
+        """
         file_path = Path(file_path)
         if not file_path.exists():
             raise FileNotFoundError(f"Ontology file not found: {file_path}")
-        
-        with open(file_path, 'r') as f:
-            data = yaml.safe_load(f)
-        
-        # Transform the data to match the expected structure
-        transformed_data = {}
-        
-        if "segments" in data:
-            transformed_data["segments"] = {}
-            for segment_name, segment_data in data["segments"].items():
-                segment_data["name"] = segment_name
-                
-                # Transform journey stages to include name field
-                if "journey_stages" in segment_data:
-                    transformed_stages = {}
-                    for stage_name, stage_data in segment_data["journey_stages"].items():
-                        stage_data["name"] = stage_name
-                        transformed_stages[stage_name] = stage_data
-                    segment_data["journey_stages"] = transformed_stages
-                
-                transformed_data["segments"][segment_name] = segment_data
-        
-        if "campaigns" in data:
-            transformed_data["campaigns"] = {}
-            for campaign_name, campaign_data in data["campaigns"].items():
-                campaign_data["name"] = campaign_name
-                transformed_data["campaigns"][campaign_name] = campaign_data
-        
-        if "lead_scoring" in data:
-            transformed_data["lead_scoring"] = data["lead_scoring"]
-        
-        if "types" in data:
-            transformed_data["types"] = data["types"]
-        
-        return cls.model_validate(transformed_data)
+
+        stat = file_path.stat()
+        return _load_cached(str(file_path.resolve()), stat.st_mtime_ns, stat.st_size, validate)
     
     @classmethod
-    def from_directory(cls, directory: Union[str, Path]) -> Ontology:
-        """Load ontology from directory containing multiple YAML files."""
+    def from_directory(
+        cls,
+        directory: Union[str, Path],
+        *,
+        errors: Optional[List[Tuple[Path, Exception]]] = None,
+        use_compiled: bool = True,
+    ) -> Ontology:
+        """Load ontology from directory containing multiple YAML files.
+
+        If a `_compiled.py` module written by ``bos compile-ontology`` is
+        present and its SOURCE_HASH still matches the YAML inputs, it is
+        imported instead of parsing YAML. Otherwise per-file loads fan
+        out across a thread pool: file reads and libyaml parsing release
+        the GIL, so multi-file ontologies load in roughly the time of
+        the slowest file. A file that fails to load is skipped; pass
+        ``errors`` to collect the (path, exception) pairs, otherwise
+        they are logged as warnings. Unexpected exceptions propagate
+        instead of being swallowed.
+        """
         directory = Path(directory)
         if not directory.exists():
             raise FileNotFoundError(f"Ontology directory not found: {directory}")
-        
+
+        if use_compiled:
+            compiled_path = directory / "_compiled.py"
+            if compiled_path.exists():
+                data = _load_compiled(compiled_path, _source_hash(directory))
+                if data is not None:
+                    # Compiled data was validated when it was written.
+                    return _construct_ontology(data)
+
+        yaml_files = _iter_yaml_files(directory)
         ontology = cls()
-        
-        # Load all YAML files in the directory and subdirectories
-        for yaml_file in directory.rglob("*.yaml"):
+        if not yaml_files:
+            return ontology
+
+        def _record(yaml_file: Path, e: Exception) -> None:
+            if errors is not None:
+                errors.append((yaml_file, e))
+            else:
+                logger.warning("Failed to load %s: %s", yaml_file, e)
+
+        def _merge(file_ontology: Ontology) -> None:
+            # Results arrive in file order, so later files still win on
+            # name collisions.
+            ontology.segments.update(file_ontology.segments)
+            ontology.campaigns.update(file_ontology.campaigns)
+            ontology.types.update(file_ontology.types)
+            if file_ontology.lead_scoring:
+                ontology.lead_scoring = file_ontology.lead_scoring
+
+        # Larger ontologies amortize process spin-up and get true
+        # cross-core parsing; parsed dicts come back pickled and are
+        # validated in the parent. Small ones stay on the thread pool,
+        # which also keeps the per-file mtime parse cache warm.
+        if len(yaml_files) >= _PROCESS_POOL_MIN_FILES:
+            from concurrent.futures import ProcessPoolExecutor
+
             try:
-                file_ontology = cls.from_file(yaml_file)
-                # Merge the ontologies
-                ontology.segments.update(file_ontology.segments)
-                ontology.campaigns.update(file_ontology.campaigns)
-                ontology.types.update(file_ontology.types)
-                if file_ontology.lead_scoring:
-                    ontology.lead_scoring = file_ontology.lead_scoring
-            except Exception as e:
-                print(f"Warning: Failed to load {yaml_file}: {e}")
-        
+                with ProcessPoolExecutor(max_workers=min(8, len(yaml_files))) as executor:
+                    results = list(executor.map(
+                        _parse_one_yaml, [str(p) for p in yaml_files], chunksize=4
+                    ))
+            except OSError:
+                results = None  # process pools unavailable; use threads
+            if results is not None:
+                for yaml_file, (raw, error) in zip(yaml_files, results):
+                    if error is not None:
+                        _record(yaml_file, error)
+                        continue
+                    try:
+                        _merge(_ONTOLOGY_ADAPTER.validate_python(_transform_raw(raw)))
+                    except PydanticValidationError as e:
+                        _record(yaml_file, e)
+                return ontology
+
+        yaml_error = _yaml()[0].YAMLError
+
+        def _load(yaml_file: Path) -> Optional[Ontology]:
+            try:
+                return cls.from_file(yaml_file)
+            except (OSError, yaml_error, PydanticValidationError) as e:
+                _record(yaml_file, e)
+                return None
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        max_workers = min(32, (os.cpu_count() or 1) * 4, len(yaml_files))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for file_ontology in executor.map(_load, yaml_files):
+                if file_ontology is not None:
+                    _merge(file_ontology)
+
         return ontology
-    
+
+    @classmethod
+    def from_directory_parallel(
+        cls,
+        directory: Union[str, Path],
+        *,
+        errors: Optional[List[Tuple[Path, Exception]]] = None,
+    ) -> Ontology:
+        """Alias for `from_directory`, which is now parallel itself."""
+        return cls.from_directory(directory, errors=errors)
+
     def validate(self) -> List[str]:
         """Validate the ontology and return list of errors."""
         errors = []
@@ -224,5 +468,139 @@ class Ontology(BaseModel):
         file_path = Path(file_path)
         file_path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(file_path, 'w') as f:
-            yaml.dump(self.to_dict(), f, default_flow_style=False, indent=2) 
\ No newline at end of file
+        yaml, _, Dumper = _yaml()
+        # exclude_none trims the emitted tree; binary mode + explicit
+        # encoding lets libyaml write bytes without a TextIO hop.
+        with open(file_path, 'wb') as f:
+            yaml.dump(
+                self.model_dump(mode='python', exclude_none=True),
+                f,
+                Dumper=Dumper,
+                default_flow_style=False,
+                sort_keys=False,
+                indent=2,
+                encoding='utf-8',
+            )
+
+
+# Prebuilt validator for the ontology tree; reused across loads instead
+# of re-entering the model_validate classmethod machinery per file.
+_ONTOLOGY_ADAPTER = TypeAdapter(Ontology)
+
+
+def _construct_ontology(data: Dict[str, Any]) -> Ontology:
+    """Assemble an Ontology without validation via model_construct."""
+    segments = {}
+    for name, seg in data.get("segments", {}).items():
+        stages = {
+            stage_name: JourneyStage(**stage_data)
+            for stage_name, stage_data in seg.get("journey_stages", {}).items()
+        }
+        segments[name] = CustomerSegment.model_construct(
+            name=seg["name"],
+            properties=seg.get("properties", {}),
+            constraints=seg.get("constraints", []),
+            journey_stages=stages,
+            description=seg.get("description"),
+        )
+    campaigns = {
+        name: Campaign.model_construct(
+            name=camp["name"],
+            metadata=camp.get("metadata", {}),
+            components=camp.get("components", {}),
+            constraints=camp.get("constraints", []),
+            description=camp.get("description"),
+        )
+        for name, camp in data.get("campaigns", {}).items()
+    }
+    lead_scoring = None
+    if data.get("lead_scoring"):
+        lead_scoring = LeadScoringModel.model_construct(**data["lead_scoring"])
+    return Ontology.model_construct(
+        segments=segments,
+        campaigns=campaigns,
+        lead_scoring=lead_scoring,
+        types=data.get("types", {}),
+    )
+
+
+def _transform_raw(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Transform raw YAML data to match the expected model structure."""
+    transformed_data = {}
+
+    if "segments" in data:
+        transformed_data["segments"] = {}
+        for segment_name, segment_data in data["segments"].items():
+            segment_data["name"] = segment_name
+
+            # Transform journey stages to include name field
+            if "journey_stages" in segment_data:
+                transformed_stages = {}
+                for stage_name, stage_data in segment_data["journey_stages"].items():
+                    stage_data["name"] = stage_name
+                    transformed_stages[stage_name] = stage_data
+                segment_data["journey_stages"] = transformed_stages
+
+            transformed_data["segments"][segment_name] = segment_data
+
+    if "campaigns" in data:
+        transformed_data["campaigns"] = {}
+        for campaign_name, campaign_data in data["campaigns"].items():
+            campaign_data["name"] = campaign_name
+            transformed_data["campaigns"][campaign_name] = campaign_data
+
+    if "lead_scoring" in data:
+        transformed_data["lead_scoring"] = data["lead_scoring"]
+
+    if "types" in data:
+        transformed_data["types"] = data["types"]
+
+    return transformed_data
+
+
+def _parse_one_yaml(path_str: str) -> Tuple[Optional[Dict[str, Any]], Optional[Exception]]:
+    """Parse one YAML file to its raw dict.
+
+    Module-level and returning plain picklable values so process pools
+    can ship both the callable and its results across workers.
+    """
+    yaml, Loader, _ = _yaml()
+    try:
+        with open(path_str, 'rb') as f:
+            data = yaml.load(f, Loader=Loader) or {}
+        if not isinstance(data, dict):
+            raise yaml.YAMLError(
+                f"Top-level YAML value must be a mapping, got {type(data).__name__}"
+            )
+        return data, None
+    except (OSError, yaml.YAMLError) as e:
+        return None, e
+
+
+@functools.lru_cache(maxsize=512)
+def _load_cached(path_str: str, mtime_ns: int, size: int, validate: bool = True) -> Ontology:
+    """Read, transform and validate one ontology file.
+
+    Keyed on path plus mtime/size so edits invalidate the entry while
+    unchanged files skip the YAML parse and pydantic validation entirely.
+    """
+    yaml, Loader, _ = _yaml()
+    # Binary mode hands libyaml the raw buffer, skipping Python-side
+    # decoding.
+    with open(path_str, 'rb') as f:
+        # Empty files parse to None; normalize like _parse_one_yaml does
+        data = yaml.load(f, Loader=Loader) or {}
+
+    # Scalar or list top levels are load failures, not crashes; raising
+    # the YAML error type keeps them inside the directory loader's
+    # warn-and-continue catch.
+    if not isinstance(data, dict):
+        raise yaml.YAMLError(
+            f"Top-level YAML value must be a mapping, got {type(data).__name__}"
+        )
+
+    transformed_data = _transform_raw(data)
+
+    if not validate:
+        return _construct_ontology(transformed_data)
+    return _ONTOLOGY_ADAPTER.validate_python(transformed_data)
@@ -4,10 +4,104 @@ Validator for Business OS ontologies.
 
 from __future__ import annotations
 
+import functools
 import re
+from collections.abc import Hashable
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union, Tuple
-from .ontology import Ontology
+from .ontology import Ontology, parse_property_type
+
+# Name-format checks run once per segment/campaign/type/property. ASCII
+# identifier + first-char case via C-level str methods is equivalent to
+# the former ^[A-Z][a-zA-Z0-9_]*\Z / ^[a-z][a-zA-Z0-9_]*\Z regexes but
+# skips the regex engine entirely.
+
+
+def _PASCAL(name: str) -> bool:
+    """True if name is a PascalCase ASCII identifier."""
+    return bool(name) and name.isascii() and name.isidentifier() and name[0].isupper()
+
+
+def _CAMEL(name: str) -> bool:
+    """True if name is a camelCase ASCII identifier."""
+    return bool(name) and name.isascii() and name.isidentifier() and name[0].islower()
+
+
+# Required-field constants, built once instead of per campaign.
+_REQUIRED_CAMPAIGN_META = ("owner_team", "campaign_type", "target_audience")
+
+# Well-formed enum definition: one or more quoted values. Compiled once;
+# replaces a per-value startswith/endswith scan in the type check.
+_QUOTED_ENUM = re.compile(r'^enum\[\s*"[^"]*"(?:\s*,\s*"[^"]*")*\s*\]$').match
+
+
+def _plain_range_check(value: float, lo: float, hi: float) -> bool:
+    return lo <= value <= hi
+
+
+@functools.lru_cache(maxsize=1)
+def _get_range_check():
+    """Return the range-check kernel, JIT-compiled when numba is present.
+
+    numba is an optional dependency and is imported lazily on the first
+    range check so CLI cold start never pays for it; without it the
+    pure-Python comparison is used unchanged.
+    """
+    try:
+        from numba import njit
+    except ImportError:
+        return _plain_range_check
+    return njit(cache=True)(_plain_range_check)
+
+
+# Sentinel for type kinds whose error messages depend on position inside
+# the value (lists); those stay on the uncached path.
+_UNCACHEABLE = object()
+
+
+@functools.lru_cache(maxsize=65536)
+def _simple_value_message(value_type: type, value: Any, type_def: str) -> Any:
+    """Pure check of a hashable value against a simple type.
+
+    Returns the error message, None when valid, or _UNCACHEABLE for
+    kinds this cache cannot answer. value_type is part of the key so
+    True/1 style equal-but-distinct values don't share entries. Batches
+    of records repeat the same few (value, type) pairs, so the cache
+    answers most checks without re-running them.
+    """
+    parsed = parse_property_type(type_def)
+    kind = parsed["kind"]
+    if kind == "enum":
+        if value not in parsed["value_set"]:
+            return f"Value '{value}' not in enum {list(parsed['cleaned_values'])}"
+        return None
+    if kind == "range":
+        try:
+            num_value = float(value)
+        except (ValueError, TypeError):
+            return "Value must be numeric for range type"
+        if not _get_range_check()(num_value, parsed["min_value"], parsed["max_value"]):
+            return f"Value {value} not in range [{parsed['min']}, {parsed['max']}]"
+        return None
+    if kind == "basic":
+        type_name = parsed["name"]
+        if type_name == "boolean":
+            if value_type is not bool:
+                return "Value must be boolean for type boolean"
+        elif type_name == "int":
+            try:
+                int(value)
+            except (ValueError, TypeError):
+                return "Value must be integer for type int"
+        elif type_name == "float":
+            try:
+                float(value)
+            except (ValueError, TypeError):
+                return "Value must be numeric for type float"
+        return None
+    if kind == "unknown":
+        return None
+    return _UNCACHEABLE
 
 
 class ValidationError:
@@ -29,65 +123,135 @@ class Validator:
     def __init__(self, ontology: Ontology):
         self.ontology = ontology
         self.errors: List[ValidationError] = []
+        self._compiled_segments: Dict[Tuple[str, int], Any] = {}
     
-    def validate_all(self) -> List[ValidationError]:
-        """Run all validation checks."""
+    def validate_all(self, fail_fast: bool = False) -> List[ValidationError]:
+        """Run all validation checks.
+
+        With ``fail_fast=True``, stop after the first pass that records
+        any issue — callers that only need a pass/fail answer skip the
+        remaining passes entirely.
+        """
         self.errors = []
-        
-        self._validate_segments()
-        self._validate_campaigns()
-        self._validate_lead_scoring()
-        self._validate_types()
-        self._validate_constraints()
-        self._validate_journey_stages()
-        
+
+        for check in (
+            self._validate_segments,
+            self._validate_campaigns,
+            self._validate_lead_scoring,
+            self._validate_types,
+        ):
+            check()
+            if fail_fast and self.errors:
+                break
+
         return self.errors
     
     def _validate_segments(self) -> None:
-        """Validate customer segments."""
+        """Validate customer segments.
+
+        Name, property, constraint and journey-stage checks all run in a
+        single walk over the segments dict, so each segment object is
+        touched once instead of three times.
+        """
+        # Local-bind the per-item names; LOAD_FAST beats LOAD_GLOBAL and
+        # repeated attribute lookups in these loops.
+        append = self.errors.append
+        VE = ValidationError
+        pascal = _PASCAL
+        camel = _CAMEL
+        validate_property = self._validate_property
         for segment_name, segment in self.ontology.segments.items():
+            location = "segments." + segment_name
             # Check segment name format
-            if not re.match(r'^[A-Z][a-zA-Z0-9_]*$', segment_name):
-                self.errors.append(ValidationError(
+            if not pascal(segment_name):
+                append(VE(
                     f"Segment name '{segment_name}' should be PascalCase",
-                    location=f"segments.{segment_name}"
+                    location=location
                 ))
             
             # Check properties
             if not segment.properties:
-                self.errors.append(ValidationError(
+                append(VE(
                     f"Segment '{segment_name}' has no properties",
-                    location=f"segments.{segment_name}"
+                    location=location
                 ))
             
-            # Validate each property
+            # Validate each property, handing over the segment's
+            # cached parsed form so the type check needn't reparse.
+            parsed_properties = segment.parsed_properties
             for prop_name, prop_def in segment.properties.items():
-                self._validate_property(prop_name, prop_def, f"segments.{segment_name}")
+                validate_property(prop_name, prop_def, location,
+                                  parsed_properties.get(prop_name))
+
+            # Validate business constraints
+            for i, constraint in enumerate(segment.constraints):
+                if not isinstance(constraint, str):
+                    append(VE(
+                        f"Constraint must be a string",
+                        location=f"{location}.constraints[{i}]"
+                    ))
+                elif len(constraint.strip()) == 0:
+                    append(VE(
+                        f"Constraint cannot be empty",
+                        location=f"{location}.constraints[{i}]"
+                    ))
+
+            # Validate journey stages
+            for stage_name, stage in segment.journey_stages.items():
+                stage_location = f"{location}.journey_stages.{stage_name}"
+                # Check stage name format
+                if not camel(stage_name):
+                    append(VE(
+                        f"Journey stage name '{stage_name}' should be camelCase",
+                        location=stage_location
+                    ))
+                
+                # Check required fields; JourneyStage always defines
+                # them, so direct reads replace hasattr/getattr reflection.
+                if not stage.duration:
+                    append(VE(
+                        f"Journey stage '{stage_name}' missing required field: duration",
+                        location=stage_location
+                    ))
+                if not stage.touchpoints:
+                    append(VE(
+                        f"Journey stage '{stage_name}' missing required field: touchpoints",
+                        location=stage_location
+                    ))
+                if not stage.success_metrics:
+                    append(VE(
+                        f"Journey stage '{stage_name}' missing required field: success_metrics",
+                        location=stage_location
+                    ))
     
     def _validate_campaigns(self) -> None:
         """Validate marketing campaigns."""
+        append = self.errors.append
+        VE = ValidationError
+        pascal = _PASCAL
         for campaign_name, campaign in self.ontology.campaigns.items():
             # Check campaign name format
-            if not re.match(r'^[A-Z][a-zA-Z0-9_]*$', campaign_name):
-                self.errors.append(ValidationError(
+            if not pascal(campaign_name):
+                append(VE(
                     f"Campaign name '{campaign_name}' should be PascalCase",
                     location=f"campaigns.{campaign_name}"
                 ))
             
-            # Check required metadata
-            required_metadata = ["owner_team", "campaign_type", "target_audience"]
-            for field in required_metadata:
-                if field not in campaign.metadata:
-                    self.errors.append(ValidationError(
-                        f"Campaign '{campaign_name}' missing required metadata: {field}",
-                        location=f"campaigns.{campaign_name}.metadata"
-                    ))
+            # Check required metadata; one extend instead of per-field appends
+            self.errors.extend(
+                VE(
+                    f"Campaign '{campaign_name}' missing required metadata: {field}",
+                    location=f"campaigns.{campaign_name}.metadata"
+                )
+                for field in _REQUIRED_CAMPAIGN_META
+                if field not in campaign.metadata
+            )
             
             # Check components
             if not campaign.components:
-                self.errors.append(ValidationError(
+                append(VE(
                     f"Campaign '{campaign_name}' has no components",
-                    location=f"campaigns.{campaign_name}"
+                    location="campaigns." + campaign_name
                 ))
     
     def _validate_lead_scoring(self) -> None:
@@ -122,36 +286,59 @@ class Validator:
     
     def _validate_types(self) -> None:
         """Validate type definitions."""
+        append = self.errors.append
+        VE = ValidationError
+        pascal = _PASCAL
+        validate_property = self._validate_property
         for type_name, type_def in self.ontology.types.items():
+            location = "types." + type_name
             # Check type name format
-            if not re.match(r'^[A-Z][a-zA-Z0-9_]*$', type_name):
-                self.errors.append(ValidationError(
+            if not pascal(type_name):
+                append(VE(
                     f"Type name '{type_name}' should be PascalCase",
-                    location=f"types.{type_name}"
+                    location=location
                 ))
             
             # Check properties
             if isinstance(type_def, dict) and "properties" in type_def:
                 for prop_name, prop_def in type_def["properties"].items():
-                    self._validate_property(prop_name, prop_def, f"types.{type_name}")
+                    validate_property(prop_name, prop_def, location)
     
-    def _validate_property(self, prop_name: str, prop_def: Any, location: str) -> None:
+    def _validate_property(self, prop_name: str, prop_def: Any, location: str,
+                           parsed: Optional[Dict[str, Any]] = None) -> None:
         """Validate a property definition."""
+        prop_location = location + "." + prop_name
         # Check property name format
-        if not re.match(r'^[a-z][a-zA-Z0-9_]*$', prop_name):
+        if not _CAMEL(prop_name):
             self.errors.append(ValidationError(
                 f"Property name '{prop_name}' should be camelCase",
-                location=f"{location}.{prop_name}"
+                location=prop_location
             ))
         
         # Validate type definition
         if isinstance(prop_def, str):
-            self._validate_type_definition(prop_def, f"{location}.{prop_name}")
+            self._validate_type_definition(prop_def, prop_location, parsed)
         elif isinstance(prop_def, dict):
-            self._validate_complex_property(prop_def, f"{location}.{prop_name}")
+            self._validate_complex_property(prop_def, prop_location)
     
-    def _validate_type_definition(self, type_def: str, location: str) -> None:
-        """Validate a type definition string."""
+    def _validate_type_definition(self, type_def: str, location: str,
+                                  parsed: Optional[Dict[str, Any]] = None) -> None:
+        """Validate a type definition string.
+
+        Well-formed definitions short-circuit through the shared parsed
+        form (per-segment cache or the parse_property_type lru); only
+        malformed strings fall through to the diagnostic checks below.
+        """
+        if parsed is None:
+            parsed = parse_property_type(type_def)
+        kind = parsed["kind"]
+        if kind == "basic" or kind == "range":
+            return
+        if kind == "enum" and _QUOTED_ENUM(type_def):
+            return
+        if kind == "list" and type_def != "list[]":
+            return
+
         # Check enum format
         if type_def.startswith("enum["):
             if not type_def.endswith("]"):
@@ -162,7 +349,7 @@ class Validator:
             else:
                 enum_content = type_def[5:-1]
                 # Check if values are properly quoted
-                if not all(val.strip().startswith('"') and val.strip().endswith('"') for val in enum_content.split(", ")):
+                if not _QUOTED_ENUM(type_def):
                     self.errors.append(ValidationError(
                         f"Enum values must be quoted: {type_def}",
                         location=location
@@ -224,76 +411,129 @@ class Validator:
             for prop_name, prop_type in prop_def["properties"].items():
                 self._validate_property(prop_name, prop_type, f"{location}.properties")
     
-    def _validate_constraints(self) -> None:
-        """Validate business constraints."""
-        for segment_name, segment in self.ontology.segments.items():
-            for i, constraint in enumerate(segment.constraints):
-                if not isinstance(constraint, str):
-                    self.errors.append(ValidationError(
-                        f"Constraint must be a string",
-                        location=f"segments.{segment_name}.constraints[{i}]"
-                    ))
-                elif len(constraint.strip()) == 0:
-                    self.errors.append(ValidationError(
-                        f"Constraint cannot be empty",
-                        location=f"segments.{segment_name}.constraints[{i}]"
-                    ))
-    
-    def _validate_journey_stages(self) -> None:
-        """Validate customer journey stages."""
-        for segment_name, segment in self.ontology.segments.items():
-            if hasattr(segment, 'journey_stages'):
-                for stage_name, stage in segment.journey_stages.items():
-                    # Check stage name format
-                    if not re.match(r'^[a-z][a-zA-Z0-9_]*$', stage_name):
-                        self.errors.append(ValidationError(
-                            f"Journey stage name '{stage_name}' should be camelCase",
-                            location=f"segments.{segment_name}.journey_stages.{stage_name}"
-                        ))
-                    
-                    # Check required fields
-                    required_fields = ["duration", "touchpoints", "success_metrics"]
-                    for field in required_fields:
-                        if not hasattr(stage, field) or not getattr(stage, field):
-                            self.errors.append(ValidationError(
-                                f"Journey stage '{stage_name}' missing required field: {field}",
-                                location=f"segments.{segment_name}.journey_stages.{stage_name}"
-                            ))
-    
     def validate_data_against_ontology(self, data: Dict[str, Any], segment_name: str) -> List[ValidationError]:
         """Validate data against a specific segment's ontology."""
-        errors = []
         segment = self.ontology.get_segment(segment_name)
-        
+
         if not segment:
-            errors.append(ValidationError(f"Segment '{segment_name}' not found"))
-            return errors
-        
-        # Check required properties
-        for prop_name, prop_def in segment.properties.items():
-            if prop_name not in data:
-                errors.append(ValidationError(
-                    f"Missing required property: {prop_name}",
-                    location=f"data.{segment_name}"
-                ))
-                continue
-            
-            # Validate property value
-            value = data[prop_name]
-            validation_error = self._validate_value_against_type(value, prop_def, prop_name)
-            if validation_error:
-                errors.append(validation_error)
-        
-        # Check for extra properties
-        for prop_name in data:
-            if prop_name not in segment.properties:
-                errors.append(ValidationError(
-                    f"Unknown property: {prop_name}",
-                    location=f"data.{segment_name}",
-                    severity="warning"
-                ))
-        
-        return errors
+            return [ValidationError(f"Segment '{segment_name}' not found")]
+
+        return self.compile_segment(segment_name)(data)
+
+    def compile_segment(self, segment_name: str) -> Any:
+        """Return a generated validator function for a segment.
+
+        The segment schema is walked once and a straight-line
+        ``validate_fn(data)`` is generated and exec'd, with property
+        names, enum sets and range bounds baked in as literals; per
+        record there is no schema re-interpretation left. Functions are
+        cached per segment instance.
+        """
+        segment = self.ontology.get_segment(segment_name)
+        if not segment:
+            raise ValueError(f"Segment {segment_name} not found")
+
+        cache_key = (segment_name, id(segment))
+        validate_fn = self._compiled_segments.get(cache_key)
+        if validate_fn is None:
+            validate_fn = self._generate_segment_validator(segment_name, segment)
+            self._compiled_segments[cache_key] = validate_fn
+        return validate_fn
+
+    def _generate_segment_validator(self, segment_name: str, segment: Any) -> Any:
+        """Build validate_fn source for a segment and exec it."""
+        seg_loc = f"data.{segment_name}"
+        namespace: Dict[str, Any] = {
+            "ValidationError": ValidationError,
+            "_validate_value": self._validate_value_against_type,
+            "_known": frozenset(segment.properties),
+        }
+        lines = [
+            "def validate_fn(data):",
+            "    errors = []",
+            # One set difference up front; per-property presence then
+            # probes the (usually empty) missing set instead of data.
+            "    _missing = _known - data.keys()",
+        ]
+        parsed_properties = segment.parsed_properties
+        for i, (prop_name, prop_def) in enumerate(segment.properties.items()):
+            parsed = parsed_properties[prop_name]
+            kind = parsed.get("kind")
+            prop_loc = f"data.{prop_name}"
+            lines.append(f"    if {prop_name!r} in _missing:")
+            lines.append(
+                f"        errors.append(ValidationError("
+                f"{f'Missing required property: {prop_name}'!r}, location={seg_loc!r}))"
+            )
+            if kind == "enum":
+                # The value list goes through the namespace rather than
+                # being embedded in the generated f-string, so quotes or
+                # braces in enum values can't break the emitted source.
+                namespace[f"_enum_{i}"] = parsed["value_set"]
+                namespace[f"_enum_values_{i}"] = list(parsed["cleaned_values"])
+                lines.append(f"    elif data[{prop_name!r}] not in _enum_{i}:")
+                lines.append(
+                    f'        errors.append(ValidationError('
+                    f'f"Value \'{{data[{prop_name!r}]}}\' not in enum {{_enum_values_{i}}}", '
+                    f'location={prop_loc!r}))'
+                )
+            elif kind == "range":
+                lines.append("    else:")
+                lines.append("        try:")
+                lines.append(f"            _num = float(data[{prop_name!r}])")
+                lines.append("        except (ValueError, TypeError):")
+                lines.append(
+                    f"            errors.append(ValidationError("
+                    f"'Value must be numeric for range type', location={prop_loc!r}))"
+                )
+                lines.append("        else:")
+                lines.append(
+                    f"            if not ({parsed['min_value']!r} <= _num <= {parsed['max_value']!r}):"
+                )
+                lines.append(
+                    f"                errors.append(ValidationError("
+                    f"f'Value {{data[{prop_name!r}]}} not in range [{parsed['min']}, {parsed['max']}]', "
+                    f"location={prop_loc!r}))"
+                )
+            elif kind == "basic" and parsed["name"] == "boolean":
+                lines.append(f"    elif not isinstance(data[{prop_name!r}], bool):")
+                lines.append(
+                    f"        errors.append(ValidationError("
+                    f"'Value must be boolean for type boolean', location={prop_loc!r}))"
+                )
+            elif kind == "basic" and parsed["name"] in ("int", "float"):
+                caster = parsed["name"] if parsed["name"] == "int" else "float"
+                message = (
+                    "Value must be integer for type int" if caster == "int"
+                    else "Value must be numeric for type float"
+                )
+                lines.append("    else:")
+                lines.append("        try:")
+                lines.append(f"            {caster}(data[{prop_name!r}])")
+                lines.append("        except (ValueError, TypeError):")
+                lines.append(
+                    f"            errors.append(ValidationError("
+                    f"{message!r}, location={prop_loc!r}))"
+                )
+            elif kind == "basic":
+                pass  # string/datetime carry no value check
+            else:
+                # Lists, complex and unknown types keep the interpreted path.
+                namespace[f"_def_{i}"] = segment.properties[prop_name]
+                lines.append("    else:")
+                lines.append(
+                    f"        _err = _validate_value(data[{prop_name!r}], _def_{i}, {prop_name!r})"
+                )
+                lines.append("        if _err:")
+                lines.append("            errors.append(_err)")
+        lines.append("    for _extra in data.keys() - _known:")
+        lines.append(
+            f"        errors.append(ValidationError("
+            f"f'Unknown property: {{_extra}}', location={seg_loc!r}, severity='warning'))"
+        )
+        lines.append("    return errors")
+        exec("\n".join(lines), namespace)
+        return namespace["validate_fn"]
     
     def _validate_value_against_type(self, value: Any, type_def: Any, prop_name: str) -> Optional[ValidationError]:
         """Validate a value against its type definition."""
@@ -305,87 +545,93 @@ class Validator:
     
     def _validate_value_against_simple_type(self, value: Any, type_def: str, prop_name: str) -> Optional[ValidationError]:
         """Validate a value against a simple type definition."""
-        if type_def.startswith("enum["):
-            enum_content = type_def[5:-1]
-            enum_values = [val.strip().strip('"') for val in enum_content.split(", ")]
-            if value not in enum_values:
-                return ValidationError(
-                    f"Value '{value}' not in enum {enum_values}",
-                    location=f"data.{prop_name}"
-                )
-        
-        elif type_def.startswith("list["):
-            if not isinstance(value, list):
-                return ValidationError(
-                    f"Value must be a list for type {type_def}",
-                    location=f"data.{prop_name}"
-                )
-            
-            inner_type = type_def[5:-1]
-            for i, item in enumerate(value):
-                item_error = self._validate_value_against_simple_type(item, inner_type, f"{prop_name}[{i}]")
-                if item_error:
-                    return item_error
-        
-        elif type_def.startswith("range("):
-            range_def = type_def[6:-1]
-            min_val, max_val = range_def.split(", ")
-            try:
-                num_value = float(value)
-                
-                # Handle units like K, M, B
-                def parse_value(val):
-                    val = val.strip()
-                    if val.endswith('K'):
-                        return float(val[:-1]) * 1000
-                    elif val.endswith('M'):
-                        return float(val[:-1]) * 1000000
-                    elif val.endswith('B'):
-                        return float(val[:-1]) * 1000000000
-                    elif val.endswith('+'):
-                        return float(val[:-1])
-                    else:
-                        return float(val)
-                
-                min_num = parse_value(min_val)
-                max_num = parse_value(max_val)
-                if not (min_num <= num_value <= max_num):
-                    return ValidationError(
-                        f"Value {value} not in range [{min_val}, {max_val}]",
-                        location=f"data.{prop_name}"
-                    )
-            except (ValueError, TypeError):
-                return ValidationError(
-                    f"Value must be numeric for range type",
-                    location=f"data.{prop_name}"
-                )
-        
-        elif type_def == "boolean" and not isinstance(value, bool):
+        if isinstance(value, Hashable):
+            message = _simple_value_message(type(value), value, type_def)
+            if message is None:
+                return None
+            if message is not _UNCACHEABLE:
+                return ValidationError(message, location=f"data.{prop_name}")
+        return self._validate_parsed_value(value, parse_property_type(type_def), prop_name)
+
+    def _validate_parsed_value(self, value: Any, parsed: Dict[str, Any], prop_name: str) -> Optional[ValidationError]:
+        """Dispatch a value check on a parsed type; the K/M/B/+ suffix and
+        enum-quote handling happened once at parse time, not per value."""
+        handler = self._PARSED_VALUE_HANDLERS.get(parsed["kind"])
+        if handler is None:
+            return None
+        return handler(self, value, parsed, prop_name)
+
+    def _check_enum_value(self, value: Any, parsed: Dict[str, Any], prop_name: str) -> Optional[ValidationError]:
+        if value not in parsed["value_set"]:
             return ValidationError(
-                f"Value must be boolean for type {type_def}",
+                f"Value '{value}' not in enum {list(parsed['cleaned_values'])}",
                 location=f"data.{prop_name}"
             )
-        
-        elif type_def == "int":
+        return None
+
+    def _check_list_value(self, value: Any, parsed: Dict[str, Any], prop_name: str) -> Optional[ValidationError]:
+        if not isinstance(value, list):
+            return ValidationError(
+                f"Value must be a list for type list[{parsed['inner'].get('name', '...')}]",
+                location=f"data.{prop_name}"
+            )
+        inner = parsed["inner"]
+        for i, item in enumerate(value):
+            item_error = self._validate_parsed_value(item, inner, f"{prop_name}[{i}]")
+            if item_error:
+                return item_error
+        return None
+
+    def _check_range_value(self, value: Any, parsed: Dict[str, Any], prop_name: str) -> Optional[ValidationError]:
+        try:
+            num_value = float(value)
+        except (ValueError, TypeError):
+            return ValidationError(
+                f"Value must be numeric for range type",
+                location=f"data.{prop_name}"
+            )
+        if not _get_range_check()(num_value, parsed["min_value"], parsed["max_value"]):
+            return ValidationError(
+                f"Value {value} not in range [{parsed['min']}, {parsed['max']}]",
+                location=f"data.{prop_name}"
+            )
+        return None
+
+    def _check_basic_value(self, value: Any, parsed: Dict[str, Any], prop_name: str) -> Optional[ValidationError]:
+        type_name = parsed["name"]
+        if type_name == "boolean":
+            if not isinstance(value, bool):
+                return ValidationError(
+                    f"Value must be boolean for type {type_name}",
+                    location=f"data.{prop_name}"
+                )
+        elif type_name == "int":
             try:
                 int(value)
             except (ValueError, TypeError):
                 return ValidationError(
-                    f"Value must be integer for type {type_def}",
+                    f"Value must be integer for type {type_name}",
                     location=f"data.{prop_name}"
                 )
-        
-        elif type_def == "float":
+        elif type_name == "float":
             try:
                 float(value)
             except (ValueError, TypeError):
                 return ValidationError(
-                    f"Value must be numeric for type {type_def}",
+                    f"Value must be numeric for type {type_name}",
                     location=f"data.{prop_name}"
                 )
-        
         return None
-    
+
+    # Dispatch table keyed by parsed-type kind; unknown kinds fall
+    # through to None, matching the old prefix-chain behavior.
+    _PARSED_VALUE_HANDLERS = {
+        "enum": _check_enum_value,
+        "list": _check_list_value,
+        "range": _check_range_value,
+        "basic": _check_basic_value,
+    }
+
     def _validate_value_against_complex_type(self, value: Any, type_def: Dict[str, Any], prop_name: str) -> Optional[ValidationError]:
         """Validate a value against a complex type definition."""
         if not isinstance(value, dict):
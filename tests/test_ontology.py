@@ -2,40 +2,101 @@
 Tests for Business OS ontology functionality.
 """
 
+import copy
+
 import pytest
+import yaml
 from pathlib import Path
 from businessos.core.ontology import Ontology
 from businessos.core.validator import Validator, ValidationError
 
+# Dump fixtures with the libyaml C dumper when available; the loader
+# side already prefers CSafeLoader inside Ontology.
+try:
+    from yaml import CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeDumper as _Dumper
+
+
+# Canonical TestCustomer data shared by the fixtures below.
+TEST_CUSTOMER_DATA = {
+    "segments": {
+        "TestCustomer": {
+            "properties": {
+                "company_size": 'enum["1-10", "11-50"]',
+                "industry": 'enum["technology", "healthcare"]',
+                "annual_revenue": "range(100K, 10M)"
+            },
+            "constraints": [
+                "Technology companies must have technical decision maker"
+            ]
+        }
+    }
+}
+
+
+@pytest.fixture(scope="session")
+def test_customer_ontology():
+    """TestCustomer ontology shared by read-only tests, built once in
+    memory with no YAML round-trip."""
+    return Ontology.from_dict(copy.deepcopy(TEST_CUSTOMER_DATA))
+
+
+@pytest.fixture(scope="module")
+def test_ontology_path(tmp_path_factory):
+    """TestCustomer ontology dumped to disk exactly once per module."""
+    path = tmp_path_factory.mktemp("ontology") / "test_ontology.yaml"
+    with open(path, 'w') as f:
+        yaml.dump(TEST_CUSTOMER_DATA, f, Dumper=_Dumper,
+                  default_flow_style=False, sort_keys=False)
+    return path
+
+
+@pytest.fixture(scope="module")
+def invalid_validation():
+    """One validate_all run shared by the invalid-ontology tests.
+
+    The ontology trips the segment-name, property-name and enum checks
+    at once; the error list is frozen to a tuple so no test can mutate
+    the shared result.
+    """
+    ontology = Ontology.from_dict({
+        "segments": {
+            "ValidCustomer": {
+                "properties": {
+                    "company_size": 'enum["1-10", "11-50"]'
+                }
+            },
+            "invalid-name": {  # Invalid: should be PascalCase
+                "properties": {
+                    "Invalid-Property": 'enum[1-10, 11-50]'  # bad case, unquoted enum
+                }
+            }
+        }
+    })
+    validator = Validator(ontology)
+    return validator, tuple(validator.validate_all())
+
+
+@pytest.fixture
+def write_ontology(tmp_path):
+    """Write ontology data as YAML under tmp_path and return the path."""
+    def _write(data, name="ontology.yaml"):
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w') as f:
+            yaml.dump(data, f, Dumper=_Dumper,
+                      default_flow_style=False, sort_keys=False)
+        return path
+    return _write
+
 
 class TestOntology:
     """Test ontology loading and parsing."""
     
-    def test_load_ontology_from_file(self, tmp_path):
+    def test_load_ontology_from_file(self, test_ontology_path):
         """Test loading ontology from a single file."""
-        # Create a test ontology file
-        ontology_data = {
-            "segments": {
-                "TestCustomer": {
-                    "properties": {
-                        "company_size": 'enum["1-10", "11-50"]',
-                        "industry": 'enum["technology", "healthcare"]',
-                        "annual_revenue": "range(100K, 10M)"
-                    },
-                    "constraints": [
-                        "Technology companies must have technical decision maker"
-                    ]
-                }
-            }
-        }
-        
-        import yaml
-        ontology_file = tmp_path / "test_ontology.yaml"
-        with open(ontology_file, 'w') as f:
-            yaml.dump(ontology_data, f)
-        
-        # Load ontology
-        ontology = Ontology.from_file(ontology_file)
+        ontology = Ontology.from_file(test_ontology_path)
         
         assert "TestCustomer" in ontology.segments
         assert len(ontology.segments) == 1
@@ -46,11 +107,9 @@ class TestOntology:
         assert "annual_revenue" in segment.properties
         assert len(segment.constraints) == 1
     
-    def test_load_ontology_from_directory(self, tmp_path):
+    def test_load_ontology_from_directory(self, tmp_path, write_ontology):
         """Test loading ontology from a directory with multiple files."""
-        # Create ontology directory structure
         ontology_dir = tmp_path / "ontology"
-        ontology_dir.mkdir()
         
         # Create segments file
         segments_data = {
@@ -81,15 +140,8 @@ class TestOntology:
             }
         }
         
-        import yaml
-        segments_file = ontology_dir / "segments.yaml"
-        campaigns_file = ontology_dir / "campaigns.yaml"
-        
-        with open(segments_file, 'w') as f:
-            yaml.dump(segments_data, f)
-        
-        with open(campaigns_file, 'w') as f:
-            yaml.dump(campaigns_data, f)
+        write_ontology(segments_data, "ontology/segments.yaml")
+        write_ontology(campaigns_data, "ontology/campaigns.yaml")
         
         # Load ontology
         ontology = Ontology.from_directory(ontology_dir)
@@ -99,24 +151,9 @@ class TestOntology:
         assert len(ontology.segments) == 1
         assert len(ontology.campaigns) == 1
     
-    def test_get_segment(self, tmp_path):
+    def test_get_segment(self, test_customer_ontology):
         """Test getting a specific segment by name."""
-        ontology_data = {
-            "segments": {
-                "TestCustomer": {
-                    "properties": {
-                        "company_size": 'enum["1-10", "11-50"]'
-                    }
-                }
-            }
-        }
-        
-        import yaml
-        ontology_file = tmp_path / "test_ontology.yaml"
-        with open(ontology_file, 'w') as f:
-            yaml.dump(ontology_data, f)
-        
-        ontology = Ontology.from_file(ontology_file)
+        ontology = test_customer_ontology
         
         segment = ontology.get_segment("TestCustomer")
         assert segment is not None
@@ -126,22 +163,15 @@ class TestOntology:
         segment = ontology.get_segment("NonExistent")
         assert segment is None
     
-    def test_list_segments(self, tmp_path):
+    def test_list_segments(self):
         """Test listing all segment names."""
-        ontology_data = {
+        ontology = Ontology.from_dict({
             "segments": {
                 "Customer1": {"properties": {}},
                 "Customer2": {"properties": {}},
                 "Customer3": {"properties": {}}
             }
-        }
-        
-        import yaml
-        ontology_file = tmp_path / "test_ontology.yaml"
-        with open(ontology_file, 'w') as f:
-            yaml.dump(ontology_data, f)
-        
-        ontology = Ontology.from_file(ontology_file)
+        })
         segments = ontology.list_segments()
         
         assert len(segments) == 3
@@ -149,13 +179,40 @@ class TestOntology:
         assert "Customer2" in segments
         assert "Customer3" in segments
 
+    def test_property_names_load_as_strings(self, tmp_path):
+        """Test that property keys are strings, enforced by the annotation."""
+        ontology_file = tmp_path / "test_ontology.yaml"
+        ontology_file.write_text(
+            "segments:\n"
+            "  TestCustomer:\n"
+            "    properties:\n"
+            "      company_size: string\n"
+            "      industry: string\n"
+        )
+
+        ontology = Ontology.from_file(ontology_file)
+        segment = ontology.segments["TestCustomer"]
+        assert all(isinstance(key, str) for key in segment.properties)
+
+        # A non-string key is rejected by the Dict[str, Any] annotation
+        # itself; no custom field validator is needed.
+        bad_file = tmp_path / "bad_ontology.yaml"
+        bad_file.write_text(
+            "segments:\n"
+            "  TestCustomer:\n"
+            "    properties:\n"
+            "      123: string\n"
+        )
+        with pytest.raises(Exception, match="string"):
+            Ontology.from_file(bad_file)
+
 
 class TestValidator:
     """Test ontology validation."""
     
-    def test_validate_valid_ontology(self, tmp_path):
+    def test_validate_valid_ontology(self):
         """Test validation of a valid ontology."""
-        ontology_data = {
+        ontology = Ontology.from_dict({
             "segments": {
                 "ValidCustomer": {
                     "properties": {
@@ -167,111 +224,36 @@ class TestValidator:
                     ]
                 }
             }
-        }
-        
-        import yaml
-        ontology_file = tmp_path / "valid_ontology.yaml"
-        with open(ontology_file, 'w') as f:
-            yaml.dump(ontology_data, f)
-        
-        ontology = Ontology.from_file(ontology_file)
+        })
         validator = Validator(ontology)
         errors = validator.validate_all()
         
         assert len(errors) == 0
     
-    def test_validate_invalid_segment_name(self, tmp_path):
+    def test_validate_invalid_segment_name(self, invalid_validation):
         """Test validation with invalid segment name format."""
-        ontology_data = {
-            "segments": {
-                "invalid-name": {  # Invalid: should be PascalCase
-                    "properties": {
-                        "company_size": 'enum["1-10", "11-50"]'
-                    }
-                }
-            }
-        }
-        
-        import yaml
-        ontology_file = tmp_path / "invalid_ontology.yaml"
-        with open(ontology_file, 'w') as f:
-            yaml.dump(ontology_data, f)
-        
-        ontology = Ontology.from_file(ontology_file)
-        validator = Validator(ontology)
-        errors = validator.validate_all()
+        _, errors = invalid_validation
         
         assert len(errors) > 0
         assert any("should be PascalCase" in str(error) for error in errors)
     
-    def test_validate_invalid_property_name(self, tmp_path):
+    def test_validate_invalid_property_name(self, invalid_validation):
         """Test validation with invalid property name format."""
-        ontology_data = {
-            "segments": {
-                "ValidCustomer": {
-                    "properties": {
-                        "Invalid-Property": 'enum["1-10", "11-50"]'  # Invalid: should be camelCase
-                    }
-                }
-            }
-        }
-        
-        import yaml
-        ontology_file = tmp_path / "invalid_ontology.yaml"
-        with open(ontology_file, 'w') as f:
-            yaml.dump(ontology_data, f)
-        
-        ontology = Ontology.from_file(ontology_file)
-        validator = Validator(ontology)
-        errors = validator.validate_all()
+        _, errors = invalid_validation
         
         assert len(errors) > 0
         assert any("should be camelCase" in str(error) for error in errors)
     
-    def test_validate_invalid_enum_definition(self, tmp_path):
+    def test_validate_invalid_enum_definition(self, invalid_validation):
         """Test validation with invalid enum definition."""
-        ontology_data = {
-            "segments": {
-                "ValidCustomer": {
-                    "properties": {
-                        "company_size": 'enum[1-10, 11-50]'  # Invalid: missing quotes
-                    }
-                }
-            }
-        }
-        
-        import yaml
-        ontology_file = tmp_path / "invalid_ontology.yaml"
-        with open(ontology_file, 'w') as f:
-            yaml.dump(ontology_data, f)
-        
-        ontology = Ontology.from_file(ontology_file)
-        validator = Validator(ontology)
-        errors = validator.validate_all()
+        _, errors = invalid_validation
         
         assert len(errors) > 0
+        assert any("must be quoted" in str(error) for error in errors)
     
-    def test_validate_data_against_ontology(self, tmp_path):
+    def test_validate_data_against_ontology(self, test_customer_ontology):
         """Test validating data against ontology."""
-        ontology_data = {
-            "segments": {
-                "TestCustomer": {
-                    "properties": {
-                        "company_size": 'enum["1-10", "11-50"]',
-                        "industry": 'enum["technology", "healthcare"]',
-                        "annual_revenue": "range(100K, 10M)"
-                    }
-                }
-            }
-        }
-        
-        import yaml
-        ontology_file = tmp_path / "test_ontology.yaml"
-        with open(ontology_file, 'w') as f:
-            yaml.dump(ontology_data, f)
-        
-        ontology = Ontology.from_file(ontology_file)
-        validator = Validator(ontology)
+        validator = Validator(test_customer_ontology)
         
         # Valid data
         valid_data = {
@@ -294,31 +276,9 @@ class TestValidator:
         assert len(errors) > 0
         assert any("not in enum" in str(error) for error in errors)
     
-    def test_validation_summary(self, tmp_path):
+    def test_validation_summary(self, invalid_validation):
         """Test validation summary generation."""
-        ontology_data = {
-            "segments": {
-                "ValidCustomer": {
-                    "properties": {
-                        "company_size": 'enum["1-10", "11-50"]'
-                    }
-                },
-                "invalid-customer": {  # Invalid name
-                    "properties": {
-                        "company_size": 'enum["1-10", "11-50"]'
-                    }
-                }
-            }
-        }
-        
-        import yaml
-        ontology_file = tmp_path / "test_ontology.yaml"
-        with open(ontology_file, 'w') as f:
-            yaml.dump(ontology_data, f)
-        
-        ontology = Ontology.from_file(ontology_file)
-        validator = Validator(ontology)
-        validator.validate_all()
+        validator, _ = invalid_validation
         
         summary = validator.get_validation_summary()
         
@@ -330,28 +290,10 @@ class TestValidator:
 class TestCompiler:
     """Test ontology compilation."""
     
-    def test_compile_to_json_schema(self, tmp_path):
+    def test_compile_to_json_schema(self, test_customer_ontology):
         """Test compilation to JSON Schema."""
-        ontology_data = {
-            "segments": {
-                "TestCustomer": {
-                    "properties": {
-                        "company_size": 'enum["1-10", "11-50"]',
-                        "industry": 'enum["technology", "healthcare"]',
-                        "annual_revenue": "range(100K, 10M)"
-                    }
-                }
-            }
-        }
-        
-        import yaml
-        ontology_file = tmp_path / "test_ontology.yaml"
-        with open(ontology_file, 'w') as f:
-            yaml.dump(ontology_data, f)
-        
-        ontology = Ontology.from_file(ontology_file)
         from businessos.core.compiler import Compiler
-        compiler = Compiler(ontology)
+        compiler = Compiler(test_customer_ontology)
         
         schema = compiler.compile_to_json_schema()
         
@@ -364,52 +306,20 @@ class TestCompiler:
         assert "industry" in customer_schema["properties"]
         assert "annual_revenue" in customer_schema["properties"]
     
-    def test_compile_specific_segment(self, tmp_path):
+    def test_compile_specific_segment(self, test_customer_ontology):
         """Test compilation of a specific segment."""
-        ontology_data = {
-            "segments": {
-                "TestCustomer": {
-                    "properties": {
-                        "company_size": 'enum["1-10", "11-50"]'
-                    }
-                }
-            }
-        }
-        
-        import yaml
-        ontology_file = tmp_path / "test_ontology.yaml"
-        with open(ontology_file, 'w') as f:
-            yaml.dump(ontology_data, f)
-        
-        ontology = Ontology.from_file(ontology_file)
         from businessos.core.compiler import Compiler
-        compiler = Compiler(ontology)
+        compiler = Compiler(test_customer_ontology)
         
         schema = compiler.compile_to_json_schema("TestCustomer")
         
         assert schema["title"] == "TestCustomer Schema"
         assert "company_size" in schema["properties"]
     
-    def test_compile_nonexistent_segment(self, tmp_path):
+    def test_compile_nonexistent_segment(self, test_customer_ontology):
         """Test compilation of non-existent segment."""
-        ontology_data = {
-            "segments": {
-                "TestCustomer": {
-                    "properties": {
-                        "company_size": 'enum["1-10", "11-50"]'
-                    }
-                }
-            }
-        }
-        
-        import yaml
-        ontology_file = tmp_path / "test_ontology.yaml"
-        with open(ontology_file, 'w') as f:
-            yaml.dump(ontology_data, f)
-        
-        ontology = Ontology.from_file(ontology_file)
         from businessos.core.compiler import Compiler
-        compiler = Compiler(ontology)
+        compiler = Compiler(test_customer_ontology)
         
         with pytest.raises(ValueError, match="Segment NonExistent not found"):
             compiler.compile_to_json_schema("NonExistent") 
\ No newline at end of file